@@ -21,9 +21,9 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 from __future__ import annotations
-from typing import TYPE_CHECKING, overload, Any, AsyncIterable
+from typing import TYPE_CHECKING, overload, Any
 
-from asyncio import get_event_loop, AbstractEventLoop, Task, sleep
+from asyncio import get_event_loop, AbstractEventLoop, Task, sleep, gather
 
 from .message import GuildMessage, PrivateMessage
 from ..enums import PermissionsFlags
@@ -124,8 +124,7 @@ class Messageable:
         attachments: list[dict[str, Any]] = []
 
         if files is not None:
-            async for attachment_data in self._upload_files(user, files):
-                attachments.append(attachment_data)
+            attachments = await self._upload_files(user, files)
 
         message_data: dict[str, Any] = await self._state.http.send_message(
             user,
@@ -134,8 +133,9 @@ class Messageable:
             attachments=attachments or None,
         )
 
-        if getattr(self, "guild", None):
-            message_data["guild_id"] = self.guild.id
+        guild: Guild | None = getattr(self, "guild", None)
+        if guild is not None:
+            message_data["guild_id"] = guild.id
 
         message: GuildMessage | PrivateMessage | None = (
             await self._state.create_message_from_data(user=user, data=message_data)
@@ -157,9 +157,11 @@ class Messageable:
             user=user, channel_id=self.id, limit=limit, message_id=message_id
         )
 
+        guild: Guild | None = getattr(self, "guild", None)
+
         for message_data in messages_data:
-            if getattr(self, "guild", None):
-                message_data["guild_id"] = self.guild.id
+            if guild is not None:
+                message_data["guild_id"] = guild.id
 
             message: GuildMessage | PrivateMessage | None = (
                 await self._state.create_message_from_data(user, message_data)
@@ -194,36 +196,40 @@ class Messageable:
 
     async def _upload_files(
         self, user: SelfBot, files: list[File]
-    ) -> AsyncIterable[dict[str, str | int]]:
-        attachments_data: list[dict[str, Any]] = []
-
-        for index, file in enumerate(files):
-            attachments_data.append(
-                {
-                    "file_size": file.size,
-                    "filename": file.name,
-                    "id": str(index),
-                }
-            )
+    ) -> list[dict[str, str | int]]:
+        attachments_data: list[dict[str, Any]] = [
+            {
+                "file_size": file.size,
+                "filename": file.name,
+                "id": str(index),
+            }
+            for index, file in enumerate(files)
+        ]
 
         response: dict[str, Any] = await self._state.http.upload_attachments(
             user=user, channel_id=self.id, files=attachments_data
         )
+        attachments: list[dict[str, Any]] = response["attachments"]
+
+        # Every file gets its own presigned url, so the uploads are
+        # independent and can run concurrently; the wall time is the
+        # slowest upload instead of the sum of all of them.
+        upload_file = self._state.http.upload_file
+        await gather(
+            *(
+                upload_file(attachment["upload_url"], file.bytes)
+                for attachment, file in zip(attachments, files)
+            )
+        )
 
-        for key, attachment in enumerate(response["attachments"]):
-            upload_url: str = attachment["upload_url"]
-            upload_id: int = attachment["id"]
-            upload_filename: str = attachment["upload_filename"]
-
-            file: File = files[key]
-
-            await self._state.http.upload_file(upload_url, file.bytes)
-
-            yield {
-                "uploaded_filename": upload_filename,
+        return [
+            {
+                "uploaded_filename": attachment["upload_filename"],
                 "filename": file.name,
-                "id": upload_id,
+                "id": attachment["id"],
             }
+            for attachment, file in zip(attachments, files)
+        ]
 
 
 class BaseFlags:
@@ -21,6 +21,7 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 from __future__ import annotations
+from typing import Any
 
 from time import time
 import re
@@ -98,6 +99,7 @@ class Activity:
         "small_image",
         "small_text",
         "application_id",
+        "_cached_dict",
     )
 
     def __init__(
@@ -137,10 +139,18 @@ class Activity:
             self._validate_url(url)
 
         self.url: str | None = url
+        self._cached_dict: dict | None = None
 
     def __repr__(self) -> str:
         return f"<Activity(name={self.name})>"
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+
+        if name != "_cached_dict":
+            # Any field change makes the serialized form stale.
+            super().__setattr__("_cached_dict", None)
+
     def _validate_url(self, url: str):
         if self.activity_type != 1:
             # According to discord docs, links only work when ActivityType is set to 1 (Streaming)
@@ -158,8 +168,18 @@ class Activity:
     def to_dict(self) -> dict:
         """
         Method to convert all information to dict.
+
+        The returned dict is a cached instance shared between calls;
+        treat it as read-only. Assigning to any activity attribute
+        rebuilds it on the next call.
         """
-        return {
+        # Serialized once and reused for presence frames that resend
+        # the same activity repeatedly; __setattr__ drops the cache
+        # whenever a field changes.
+        if self._cached_dict is not None:
+            return self._cached_dict
+
+        self._cached_dict = {
             "name": self.name,
             "type": self.activity_type,
             "emoji": self.emoji_data,
@@ -176,3 +196,4 @@ class Activity:
                 "small_image": self.small_image,
             },
         }
+        return self._cached_dict
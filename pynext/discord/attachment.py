@@ -53,6 +53,24 @@ class Attachment(Hashable, Generic[MessageT]):
         The attachment's flags.
     """
 
+    __slots__ = (
+        "message",
+        "id",
+        "filename",
+        "size",
+        "url",
+        "proxy_url",
+        "spoiler",
+        "description",
+        "content_type",
+        "height",
+        "width",
+        "ephemeral",
+        "duration_secs",
+        "waveform",
+        "flags",
+    )
+
     def __init__(self, data: dict[str, Any], message: MessageT):
         self.message: MessageT = message
         self.id: int = int(data["id"])
@@ -37,6 +37,10 @@ if TYPE_CHECKING:
     from ..state import State
     from .channel import DMChannel
 
+# Cached at import time. Enum __len__ is a Python-level call,
+# and the amount of default avatars never changes at runtime.
+_DEFAULT_AVATARS_COUNT: int = len(DefaultAvatar)
+
 
 class DiscordUser(Hashable):
     """
@@ -73,6 +77,7 @@ class DiscordUser(Hashable):
         "id",
         "_state",
         "bot",
+        "_created_at",
     )
 
     def __init__(self, state: State, user_data: dict[str, Any]):
@@ -91,6 +96,8 @@ class DiscordUser(Hashable):
         self.discriminator: str = data["discriminator"]
         self.avatar_id: str | None = data["avatar"]
 
+        self._created_at: datetime | None = None
+
     def __repr__(self) -> str:
         return f"<DiscordUser(username={self.username}, id={self.id})>"
 
@@ -99,7 +106,12 @@ class DiscordUser(Hashable):
         """
         Datetime object when the user has been created.
         """
-        return snowflake_time(self.id)
+        # The id never changes, so the snowflake_time result
+        # is computed once and reused on later accesses.
+        if self._created_at is None:
+            self._created_at = snowflake_time(self.id)
+
+        return self._created_at
 
     @property
     def display_avatar(self) -> Image:
@@ -126,7 +138,7 @@ class DiscordUser(Hashable):
         Default user avatar
         """
         if self.discriminator != "0":
-            avatar_index: int = (self.id >> 22) % len(DefaultAvatar)
+            avatar_index: int = (self.id >> 22) % _DEFAULT_AVATARS_COUNT
         else:
             avatar_index: int = int(self.discriminator) % 5
 
@@ -48,7 +48,7 @@ class Emoji:
         Emoji encode format.
     """
 
-    __slots__ = ("name", "animated", "id", "encode")
+    __slots__ = ("name", "animated", "id", "_encode")
 
     def __init__(self, name: str, animated: bool = False, emoji_id: int | None = None):
         self.name: str = name
@@ -56,12 +56,7 @@ class Emoji:
         self.animated: bool = animated
         self.id: int | None = emoji_id
 
-        if not self.id:
-            self.encode: str = self.name
-        else:
-            self.encode: str = (
-                f"{self.name}:{self.id}" if not animated else f"a:{self.name}:{self.id}"
-            )
+        self._encode: str | None = None
 
     def __repr__(self) -> str:
         return f"<Emoji(name={self.name}, id={self.id})>"
@@ -77,6 +72,28 @@ class Emoji:
     def __hash__(self) -> int:
         return hash((self.name, self.animated, self.id))
 
+    @property
+    def encode(self) -> str:
+        """
+        Emoji encode format.
+        """
+        # Built lazily. Most emojis parsed from gateway payloads
+        # are never sent back, so the f-string work can be skipped.
+        encode: str | None = self._encode
+
+        if encode is None:
+            if not self.id:
+                encode = self.name
+            else:
+                encode = (
+                    f"{self.name}:{self.id}"
+                    if not self.animated
+                    else f"a:{self.name}:{self.id}"
+                )
+            self._encode = encode
+
+        return encode
+
     @property
     def unique_id(self) -> int:
         """
@@ -1,5 +1,7 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
+
+from asyncio import gather, to_thread
 
 if TYPE_CHECKING:
     from os import PathLike
@@ -61,6 +63,37 @@ class File:
         if spoiler and not self.name.startswith("SPOILER_"):
             self.name = "SPOILER_" + self.name
 
+    @classmethod
+    async def load_many(
+        cls, files: Sequence[tuple[PathLike | str, str]]
+    ) -> list[File]:
+        """
+        Classmethod to load multiple files at once.
+
+        Each file is read in a separate thread, so the reads run
+        concurrently and don't block the event loop.
+
+        .. versionadded:: 1.2.0
+
+        Parameters
+        ----------
+        files:
+            Sequence of ``(path, name)`` pairs to load.
+        """
+        contents: list[bytes] = await gather(
+            *(to_thread(cls._read_file, path) for path, _ in files)
+        )
+
+        return [
+            cls(fp=file_bytes, name=name)
+            for file_bytes, (_, name) in zip(contents, files)
+        ]
+
+    @staticmethod
+    def _read_file(path: PathLike | str) -> bytes:
+        with open(path, mode="rb") as file:
+            return file.read()
+
     def __repr__(self) -> str:
         return f"<File(name={self.name}, spoiler={self.spoiler})>"
 
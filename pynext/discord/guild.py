@@ -21,7 +21,7 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 from __future__ import annotations
-from typing import AsyncIterable
+from typing import AsyncIterable, Callable
 
 from ..utils import applications_filter
 from .channel import *
@@ -43,6 +43,27 @@ if TYPE_CHECKING:
     from ..selfbot import SelfBot
     from ..types import Channel
 
+# Maps concrete channel classes to the per-type dict they live in,
+# so _add_channel / _remove_channel dispatch with a single dict lookup
+# instead of an isinstance chain.
+_CHANNEL_BUCKETS: dict[type, str] = {
+    TextChannel: "_text_channels",
+    VoiceChannel: "_voice_channels",
+    CategoryChannel: "_category_channels",
+}
+
+# Channel type values resolved once at import,
+# instead of an enum attribute lookup per create_* call.
+_TEXT_TYPE: int = ChannelType.GUILD_TEXT.value
+_VOICE_TYPE: int = ChannelType.GUILD_VOICE.value
+_CATEGORY_TYPE: int = ChannelType.GUILD_CATEGORY.value
+
+
+def _compact(params: dict[str, Any]) -> dict[str, Any]:
+    # Unset fields don't need to go over the wire,
+    # so None values are stripped before serialization.
+    return {key: value for key, value in params.items() if value is not None}
+
 
 class Guild(Hashable):
     """
@@ -95,10 +116,24 @@ class Guild(Hashable):
         "afk_timeout",
         "premium_progress_bar_enabled",
         "_roles",
+        "_raw_roles",
+        "_raw_emojis",
         "_channels",
+        "_text_channels",
+        "_voice_channels",
+        "_category_channels",
         "_members",
         "_emojis",
         "_applications",
+        "_roles_cache",
+        "_channels_cache",
+        "_text_channels_cache",
+        "_voice_channels_cache",
+        "_category_channels_cache",
+        "_members_cache",
+        "_emojis_cache",
+        "_applications_cache",
+        "_icon_cache",
     )
 
     def __init__(self, state: State, data: dict[str, Any]):
@@ -124,23 +159,33 @@ class Guild(Hashable):
 
         self._roles: dict[int, Role] = {}
         self._channels: dict[int, Channel] = {}
+        self._text_channels: dict[int, TextChannel] = {}
+        self._voice_channels: dict[int, VoiceChannel] = {}
+        self._category_channels: dict[int, CategoryChannel] = {}
         self._members: dict[int, GuildMember] = {}
-        self._emojis: set[Emoji] = set()
+        self._emojis: dict[int, Emoji] = {}
         self._applications: dict[int, Application] = {}
 
-        for role_data in data["roles"]:
-            role = Role(guild=self, data=role_data)
-
-            self._roles[role.id] = role
-
-        for emoji_data in data["emojis"]:
-            emoji = Emoji(
-                name=emoji_data["name"],
-                animated=emoji_data["animated"],
-                emoji_id=int(emoji_data["id"]),
-            )
-
-            self._emojis.add(emoji)
+        # Materialized list views returned by the properties below.
+        # Rebuilt lazily after the _add_* / _remove_* helpers reset them,
+        # so hot paths don't allocate a fresh list on every access.
+        self._roles_cache: list[Role] | None = None
+        self._channels_cache: list[Channel] | None = None
+        self._text_channels_cache: list[TextChannel] | None = None
+        self._voice_channels_cache: list[VoiceChannel] | None = None
+        self._category_channels_cache: list[CategoryChannel] | None = None
+        self._members_cache: list[GuildMember] | None = None
+        self._emojis_cache: list[Emoji] | None = None
+        self._applications_cache: list[Application] | None = None
+        self._icon_cache: tuple[str, Image] | None = None
+
+        # Role / Emoji objects are inflated lazily from the raw payloads.
+        # Large guilds carry hundreds of them in GUILD_CREATE and most
+        # consumers only ever look up a few by id.
+        self._raw_roles: dict[int, dict[str, Any]] = {
+            int(role_data["id"]): role_data for role_data in data["roles"]
+        }
+        self._raw_emojis: list[dict[str, Any]] | None = data["emojis"]
 
     def __repr__(self) -> str:
         return f"<Guild(name={self.name}, id={self.id})>"
@@ -192,68 +237,102 @@ class Guild(Hashable):
         """
         Image object representing the guild icon.
         """
-        if self.icon_id is None:
+        icon_id: str | None = self.icon_id
+        if icon_id is None:
             return None
 
-        return Image._from_guild_icon(
-            state=self._state, guild_id=self.id, icon_id=self.icon_id
-        )
+        # Image objects are immutable, so the same instance is reused
+        # until the guild icon actually changes.
+        if self._icon_cache is None or self._icon_cache[0] != icon_id:
+            self._icon_cache = (
+                icon_id,
+                Image._from_guild_icon(
+                    state=self._state, guild_id=self.id, icon_id=icon_id
+                ),
+            )
+
+        return self._icon_cache[1]
 
     @property
     def emojis(self) -> list[Emoji]:
         """
         List with emojis on the guild.
         """
-        return list(self._emojis)
+        self._inflate_emojis()
+
+        if self._emojis_cache is None:
+            self._emojis_cache = list(self._emojis.values())
+
+        return self._emojis_cache
 
     @property
     def roles(self) -> list[Role]:
         """
         List with roles on the guild.
         """
-        return list(self._roles.values())
+        self._inflate_roles()
+
+        if self._roles_cache is None:
+            self._roles_cache = list(self._roles.values())
+
+        return self._roles_cache
 
     @property
     def default_role(self) -> Role | None:
         """
         Guild default (@everyone) role.
         """
-        return self._roles.get(self.id)
+        return self.get_role(self.id)
 
     @property
     def channels(self) -> list[Channel]:
         """
         A list with all the channels on the guild.
         """
-        return list(self._channels.values())
+        if self._channels_cache is None:
+            self._channels_cache = list(self._channels.values())
+
+        return self._channels_cache
 
     @property
     def text_channels(self) -> list[TextChannel]:
         """
         List with all text channels on the guild.
         """
-        return list(filter(lambda c: isinstance(c, TextChannel), self.channels))  # type: ignore
+        if self._text_channels_cache is None:
+            self._text_channels_cache = list(self._text_channels.values())
+
+        return self._text_channels_cache
 
     @property
     def voice_channels(self) -> list[VoiceChannel]:
         """
         List with all voice channels on the guild.
         """
-        return list(filter(lambda c: isinstance(c, VoiceChannel), self.channels))  # type: ignore
+        if self._voice_channels_cache is None:
+            self._voice_channels_cache = list(self._voice_channels.values())
+
+        return self._voice_channels_cache
 
     @property
     def category_channels(self) -> list[CategoryChannel]:
         """
         List of all category channels in the guild.
         """
-        return list(filter(lambda c: isinstance(c, CategoryChannel), self.channels))  # type: ignore
+        if self._category_channels_cache is None:
+            self._category_channels_cache = list(self._category_channels.values())
+
+        return self._category_channels_cache
 
     @property
     def members(self) -> list[GuildMember]:
         """
         List with members on the guild.
         """
-        return list(self._members.values())
+        if self._members_cache is None:
+            self._members_cache = list(self._members.values())
+
+        return self._members_cache
 
     @property
     def applications(self) -> list[Application]:
@@ -262,7 +341,10 @@ class Guild(Hashable):
 
         .. versionadded:: 1.0.8
         """
-        return list(self._applications.values())
+        if self._applications_cache is None:
+            self._applications_cache = list(self._applications.values())
+
+        return self._applications_cache
 
     def get_application(self, application_id: int) -> Application | None:
         """
@@ -286,7 +368,26 @@ class Guild(Hashable):
         role_id:
             Id of the role object.
         """
-        return self._roles.get(role_id)
+        role: Role | None = self._roles.get(role_id)
+
+        if role is None:
+            if role_data := self._raw_roles.pop(role_id, None):
+                role = Role(guild=self, data=role_data)
+                self._add_role(role)
+
+        return role
+
+    def get_emoji(self, emoji_id: int) -> Emoji | None:
+        """
+        Method to get a guild emoji by id.
+
+        Parameters
+        ----------
+        emoji_id:
+            Id of the emoji object.
+        """
+        self._inflate_emojis()
+        return self._emojis.get(emoji_id)
 
     def get_channel(self, channel_id: int) -> Channel | None:
         """
@@ -349,7 +450,10 @@ class Guild(Hashable):
         return BanEntry(state=self._state, data=data)
 
     async def fetch_bans(
-        self, user: SelfBot, limit: int = 1000
+        self,
+        user: SelfBot,
+        limit: int = 1000,
+        factory: Callable[[dict[str, Any]], Any] | None = None,
     ) -> AsyncIterable[BanEntry]:
         """
         Method to fetch guild bans.
@@ -360,6 +464,12 @@ class Guild(Hashable):
             Selfbot to send request.
         limit:
             Maximum amount of fetched bans.
+        factory:
+            Optional callable receiving the raw ban data and returning
+            the yielded object. Useful to skip :class:`BanEntry`
+            construction when scanning large ban lists for a single user.
+
+            .. versionadded:: 1.2.0
 
         Raises
         ------
@@ -372,11 +482,23 @@ class Guild(Hashable):
         Forbidden
             Selfbot doesn't have proper permissions.
         """
-        for ban_data in await user.http.fetch_guild_bans(
+        bans_data: list[dict[str, Any]] = await user.http.fetch_guild_bans(
             user=user, guild_id=self.id, limit=limit
-        ):
-            ban_data["guild_id"] = self.id
-            yield BanEntry(state=self._state, data=ban_data)
+        )
+
+        guild_id: int = self.id
+        for ban_data in bans_data:
+            ban_data["guild_id"] = guild_id
+
+        if factory is None:
+            state: State = self._state
+            entry_cls: type[BanEntry] = BanEntry
+
+            for ban_data in bans_data:
+                yield entry_cls(state=state, data=ban_data)
+        else:
+            for ban_data in bans_data:
+                yield factory(ban_data)
 
     async def fetch_roles(self, user: SelfBot) -> list[Role]:
         """
@@ -405,9 +527,9 @@ class Guild(Hashable):
         for role_data in data:
             role = Role(guild=self, data=role_data)
 
-            self._roles[role.id] = role
+            self._add_role(role)
 
-        return list(self._roles.values())
+        return self.roles
 
     async def fetch_channel(self, user: SelfBot, channel_id: int) -> Channel:
         """
@@ -528,11 +650,14 @@ class Guild(Hashable):
         data: dict[str, Any] = await self._state.http.fetch_applications(
             user, guild_id=self.id
         )
-        self._applications = {}
-
-        for app_data in applications_filter(data).values():
-            application: Application = self._state.create_application(app_data)
-            self._add_application(application)
+        create_application = self._state.create_application
+        self._applications = {
+            application.id: application
+            for application in (
+                create_application(app_data) for app_data in applications_filter(data)
+            )
+        }
+        self._applications_cache = None
 
         return self.applications
 
@@ -574,13 +699,17 @@ class Guild(Hashable):
         Forbidden
             Selfbot doesn't have proper permissions.
         """
-        params: dict[str, Any] = {
-            "name": name,
-            "permissions": permissions.get_bitwise_by_flags() if permissions else None,
-            "color": color.value if color else None,
-            "hoist": hoist,
-            "mentionable": mentionable,
-        }
+        params: dict[str, Any] = _compact(
+            {
+                "name": name,
+                "permissions": permissions.get_bitwise_by_flags()
+                if permissions
+                else None,
+                "color": color.value if color else None,
+                "hoist": hoist,
+                "mentionable": mentionable,
+            }
+        )
 
         data: dict[str, Any] = await self._state.http.create_role(
             user, guild_id=self.id, params=params
@@ -637,16 +766,18 @@ class Guild(Hashable):
         if overwrites is not None:
             permission_overwrites = self._state.to_overwrite_payload(overwrites)
 
-        params: dict[str, Any] = {
-            "name": name,
-            "type": ChannelType.GUILD_TEXT.value,
-            "topic": topic,
-            "parent_id": parent.id if parent else None,
-            "position": position,
-            "nsfw": nsfw,
-            "permission_overwrites": permission_overwrites,
-            "rate_limit_per_user": slowmode,
-        }
+        params: dict[str, Any] = _compact(
+            {
+                "name": name,
+                "type": _TEXT_TYPE,
+                "topic": topic,
+                "parent_id": parent.id if parent else None,
+                "position": position,
+                "nsfw": nsfw,
+                "permission_overwrites": permission_overwrites,
+                "rate_limit_per_user": slowmode,
+            }
+        )
 
         data: dict[str, Any] = await self._state.http.create_channel(
             user=user, guild_id=self.id, params=params
@@ -711,18 +842,20 @@ class Guild(Hashable):
         if overwrites is not None:
             permission_overwrites = self._state.to_overwrite_payload(overwrites)
 
-        params: dict[str, Any] = {
-            "name": name,
-            "type": ChannelType.GUILD_VOICE.value,
-            "parent_id": parent.id if parent else None,
-            "position": position,
-            "nsfw": nsfw,
-            "permission_overwrites": permission_overwrites,
-            "rate_limit_per_user": slowmode,
-            "user_limit": user_limit,
-            "bitrate": bitrate,
-            "video_quality_mode": video_quality_mode,
-        }
+        params: dict[str, Any] = _compact(
+            {
+                "name": name,
+                "type": _VOICE_TYPE,
+                "parent_id": parent.id if parent else None,
+                "position": position,
+                "nsfw": nsfw,
+                "permission_overwrites": permission_overwrites,
+                "rate_limit_per_user": slowmode,
+                "user_limit": user_limit,
+                "bitrate": bitrate,
+                "video_quality_mode": video_quality_mode,
+            }
+        )
 
         data: dict[str, Any] = await self._state.http.create_channel(
             user=user, guild_id=self.id, params=params
@@ -769,12 +902,14 @@ class Guild(Hashable):
         if overwrites is not None:
             permission_overwrites = self._state.to_overwrite_payload(overwrites)
 
-        params: dict[str, Any] = {
-            "name": name,
-            "type": ChannelType.GUILD_CATEGORY.value,
-            "position": position,
-            "permission_overwrites": permission_overwrites,
-        }
+        params: dict[str, Any] = _compact(
+            {
+                "name": name,
+                "type": _CATEGORY_TYPE,
+                "position": position,
+                "permission_overwrites": permission_overwrites,
+            }
+        )
 
         data: dict[str, Any] = await self._state.http.create_channel(
             user=user, guild_id=self.id, params=params
@@ -784,41 +919,84 @@ class Guild(Hashable):
         assert isinstance(channel, CategoryChannel)
         return channel
 
+    def _inflate_roles(self) -> None:
+        if not self._raw_roles:
+            return
+
+        for role_data in self._raw_roles.values():
+            role = Role(guild=self, data=role_data)
+
+            if role.id not in self._roles:
+                self._roles[role.id] = role
+
+        self._raw_roles = {}
+        self._roles_cache = None
+
+    def _inflate_emojis(self) -> None:
+        if self._raw_emojis is None:
+            return
+
+        for emoji_data in self._raw_emojis:
+            emoji_id: int = int(emoji_data["id"])
+
+            self._emojis[emoji_id] = Emoji(
+                name=emoji_data["name"],
+                animated=emoji_data["animated"],
+                emoji_id=emoji_id,
+            )
+
+        self._raw_emojis = None
+        self._emojis_cache = None
+
+    def _invalidate_channel_caches(self) -> None:
+        self._channels_cache = None
+        self._text_channels_cache = None
+        self._voice_channels_cache = None
+        self._category_channels_cache = None
+
     def _add_emoji(self, emoji: Emoji) -> None:
-        self._emojis.add(emoji)
+        self._emojis[emoji.id] = emoji  # type: ignore
+        self._emojis_cache = None
 
-    def _remove_emoji(self, emoji: Emoji) -> None:
-        try:
-            self._emojis.remove(emoji)
-        except KeyError:
-            pass
+    def _remove_emoji(self, emoji_id: int | None) -> None:
+        self._inflate_emojis()
+
+        self._emojis.pop(emoji_id, None)  # type: ignore
+        self._emojis_cache = None
 
     def _add_role(self, role: Role) -> None:
         self._roles[role.id] = role
+        self._roles_cache = None
 
     def _remove_role(self, role_id: int) -> None:
-        try:
-            del self._roles[role_id]
-        except KeyError:
-            pass
+        self._roles.pop(role_id, None)
+        self._roles_cache = None
 
     def _add_channel(self, channel: Channel) -> None:
         self._channels[channel.id] = channel
 
+        if bucket := _CHANNEL_BUCKETS.get(type(channel)):
+            getattr(self, bucket)[channel.id] = channel
+
+        self._invalidate_channel_caches()
+
     def _remove_channel(self, channel_id: int) -> None:
-        try:
-            del self._channels[channel_id]
-        except KeyError:
-            pass
+        channel = self._channels.pop(channel_id, None)
+
+        if channel is not None:
+            if bucket := _CHANNEL_BUCKETS.get(type(channel)):
+                getattr(self, bucket).pop(channel_id, None)
+
+        self._invalidate_channel_caches()
 
     def _add_member(self, member: GuildMember) -> None:
         self._members[member.id] = member
+        self._members_cache = None
 
     def _remove_member(self, member_id: int) -> None:
-        try:
-            del self._members[member_id]
-        except KeyError:
-            pass
+        self._members.pop(member_id, None)
+        self._members_cache = None
 
     def _add_application(self, application: Application) -> None:
         self._applications[application.id] = application
+        self._applications_cache = None
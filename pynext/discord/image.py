@@ -23,6 +23,9 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 from typing import TYPE_CHECKING, ClassVar
 
+from functools import lru_cache
+from asyncio import to_thread
+
 if TYPE_CHECKING:
     from os import PathLike
 
@@ -53,6 +56,20 @@ class Image:
     __slots__ = ("_state", "animated", "url")
     BASE_URL: ClassVar[str] = "https://cdn.discordapp.com"
 
+    # Url templates precomputed at class load, so the constant parts
+    # aren't rebuilt by every _from_* call.
+    _USER_AVATAR_STATIC: ClassVar[str] = BASE_URL + "/avatars/%s/%s.webp?size=80"
+    _USER_AVATAR_ANIMATED: ClassVar[str] = BASE_URL + "/avatars/%s/%s.gif?size=80"
+    _DEFAULT_AVATAR: ClassVar[str] = BASE_URL + "/embed/avatars/%s.png"
+    _GUILD_AVATAR_STATIC: ClassVar[str] = (
+        BASE_URL + "/guilds/%s/users/%s/avatars/%s.png?size=1024"
+    )
+    _GUILD_AVATAR_ANIMATED: ClassVar[str] = (
+        BASE_URL + "/guilds/%s/users/%s/avatars/%s.gif?size=1024"
+    )
+    _GUILD_ICON_STATIC: ClassVar[str] = BASE_URL + "/icons/%s/%s.png?size=1024"
+    _GUILD_ICON_ANIMATED: ClassVar[str] = BASE_URL + "/icons/%s/%s.gif?size=1024"
+
     def __init__(self, state: State, url: str, animated: bool = False) -> None:
         self._state: State = state
 
@@ -73,9 +90,7 @@ class Image:
         Method to save image.
         """
         file_bytes: bytes = await self.get_bytes()
-
-        with open(path, mode="wb") as file:
-            file.write(file_bytes)
+        await to_thread(_write_file, path, file_bytes)
 
     @classmethod
     def _from_user(cls, state: State, user_id: int, avatar_id: str) -> Image:
@@ -91,12 +106,14 @@ class Image:
         avatar_id:
             Avatar id of the user.
         """
-        animated: bool = avatar_id.startswith("a_")
-        file_type: str = "gif" if animated else "webp"
+        animated: bool = avatar_id[:2] == "a_"
+        template: str = (
+            cls._USER_AVATAR_ANIMATED if animated else cls._USER_AVATAR_STATIC
+        )
 
         return cls(
             state=state,
-            url=f"{cls.BASE_URL}/avatars/{user_id}/{avatar_id}.{file_type}?size=80",
+            url=template % (user_id, avatar_id),
             animated=animated,
         )
 
@@ -114,7 +131,7 @@ class Image:
         """
         return cls(
             state=state,
-            url=f"{cls.BASE_URL}/embed/avatars/{avatar_id}.png",
+            url=cls._DEFAULT_AVATAR % (avatar_id,),
         )
 
     @classmethod
@@ -135,14 +152,7 @@ class Image:
         avatar_id:
             Avatar id.
         """
-        animated: bool = avatar_id.startswith("a_")
-        file_type: str = "gif" if animated else "png"
-
-        return cls(
-            state=state,
-            url=f"{cls.BASE_URL}/guilds/{guild_id}/users/{user_id}/avatars/{avatar_id}.{file_type}?size=1024",
-            animated=animated,
-        )
+        return _guild_avatar_image(state, guild_id, user_id, avatar_id)
 
     @classmethod
     def _from_guild_icon(cls, state: State, guild_id: int, icon_id: str) -> Image:
@@ -158,11 +168,39 @@ class Image:
         icon_id:
             Icon id.
         """
-        animated: bool = icon_id.startswith("a_")
-        file_type: str = "gif" if animated else "png"
+        animated: bool = icon_id[:2] == "a_"
+        template: str = (
+            cls._GUILD_ICON_ANIMATED if animated else cls._GUILD_ICON_STATIC
+        )
 
         return cls(
             state=state,
-            url=f"{cls.BASE_URL}/icons/{guild_id}/{icon_id}.{file_type}?size=1024",
+            url=template % (guild_id, icon_id),
             animated=animated,
         )
+
+
+def _write_file(path: PathLike | str, data: bytes) -> None:
+    # Runs in a worker thread, so large writes
+    # don't block the event loop.
+    with open(path, mode="wb") as file:
+        file.write(data)
+
+
+@lru_cache(maxsize=4096)
+def _guild_avatar_image(
+    state: State, guild_id: int, user_id: int, avatar_id: str
+) -> Image:
+    # Guild avatar Images are immutable and requested on every
+    # GuildMember.guild_avatar access, so identical keys reuse
+    # the same instance instead of reformatting the url.
+    animated: bool = avatar_id[:2] == "a_"
+    template: str = (
+        Image._GUILD_AVATAR_ANIMATED if animated else Image._GUILD_AVATAR_STATIC
+    )
+
+    return Image(
+        state=state,
+        url=template % (guild_id, user_id, avatar_id),
+        animated=animated,
+    )
@@ -23,7 +23,11 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Iterable
 
-from datetime import datetime, timezone
+from array import array
+from bisect import bisect_left
+from datetime import datetime
+from functools import lru_cache
+from time import time
 
 from ..utils import str_to_datetime
 
@@ -37,6 +41,10 @@ if TYPE_CHECKING:
     from .guild import Guild
     from .channel import VoiceChannel
 
+# The same role id strings arrive in every member payload of a guild,
+# so repeated snowflake parsing is memoized instead of redone per member.
+_snowflake = lru_cache(maxsize=4096)(int)
+
 
 class GuildMember(DiscordUser):
     """
@@ -73,8 +81,10 @@ class GuildMember(DiscordUser):
 
     __slots__ = (
         "guild",
-        "_roles",
+        "_role_ids",
+        "_roles_cache",
         "_muted",
+        "_mute_until_ts",
         "nickname",
         "communication_disabled_until",
     )
@@ -86,14 +96,19 @@ class GuildMember(DiscordUser):
         self.nickname: str | None = data.get("nick")
 
         self.communication_disabled_until: None | datetime = None
+        self._mute_until_ts: float | None = None
+
         if timeout_value := data.get("communication_disabled_until"):
             self.communication_disabled_until = str_to_datetime(timeout_value)
+            self._mute_until_ts = self.communication_disabled_until.timestamp()
 
-        self._roles: dict[int, Role] = {}
-
-        for role_id in data.get("roles", []):
-            if role := self.guild.get_role(int(role_id)):
-                self._roles[role.id] = role
+        # Only the sorted ids are stored (8 bytes each); Role objects
+        # are resolved through the guild cache on demand, so large
+        # guilds don't pay a dict entry per role per member.
+        self._role_ids: array[int] = array(
+            "Q", sorted(map(_snowflake, data.get("roles", ())))
+        )
+        self._roles_cache: list[Role] | None = None
 
     def __repr__(self) -> str:
         return f"<GuildMember(username={self.guild_nickname}, id={self.id})>"
@@ -128,16 +143,59 @@ class GuildMember(DiscordUser):
         """
         SelfBot roles on the guild.
         """
-        return list(self._roles.values())
+        # Permission checks iterate this repeatedly, so the list view
+        # is materialized only after the role index changes.
+        if self._roles_cache is None:
+            get_role = self.guild.get_role
+            self._roles_cache = [
+                role for role_id in self._role_ids if (role := get_role(role_id))
+            ]
+
+        return self._roles_cache
+
+    def get_role(self, role_id: int) -> Role | None:
+        """
+        Method to get a member role by id.
+
+        .. versionadded:: 1.2.0
+
+        Parameters
+        ----------
+        role_id:
+            Id of the role object.
+        """
+        if not self.has_role(role_id):
+            return None
+
+        return self.guild.get_role(role_id)
+
+    def has_role(self, role: Role | int) -> bool:
+        """
+        Method to check whether the member has a role.
+
+        Prefer this over ``role in member.roles``, as it's a binary
+        search over the role id index instead of a linear scan.
+
+        .. versionadded:: 1.2.0
+
+        Parameters
+        ----------
+        role:
+            Role object or id to check.
+        """
+        role_id: int = role if isinstance(role, int) else role.id
+        role_ids: array[int] = self._role_ids
+
+        index: int = bisect_left(role_ids, role_id)
+        return index < len(role_ids) and role_ids[index] == role_id
 
     def is_muted(self) -> bool:
         """
         Whether the user is muted.
         """
-        if self.communication_disabled_until is None:
-            return False
-
-        return self.communication_disabled_until > datetime.now(timezone.utc)
+        # Comparing the precomputed POSIX timestamp against time()
+        # avoids constructing a fresh datetime object on every check.
+        return self._mute_until_ts is not None and self._mute_until_ts > time()
 
     async def fetch_roles(self, user: SelfBot) -> list[Role]:
         """
@@ -163,11 +221,8 @@ class GuildMember(DiscordUser):
             user=user, guild_id=self.guild.id, member_id=self.id
         )
 
-        self._roles = {}
-
-        for role_id in data["roles"]:
-            if role := self.guild.get_role(int(role_id)):
-                self._roles[role.id] = role
+        self._role_ids = array("Q", sorted(map(_snowflake, data["roles"])))
+        self._roles_cache = None
 
         return self.roles
 
@@ -215,22 +270,20 @@ class GuildMember(DiscordUser):
         Forbidden
             Selfbot doesn't have proper permissions.
         """
+        # Parameters with a value of None are left out of the dict,
+        # because they could overwrite an already set parameter.
         params: dict[str, Any] = {
-            "nick": nick,
-            "roles_to_add": roles_to_add,
-            "roles_to_remove": roles_to_remove,
-            "communication_disabled_until": communication_disabled_until,
-            "voice_channel_id": voice_channel.id if voice_channel else None,
+            key: value
+            for key, value in (
+                ("nick", nick),
+                ("roles_to_add", roles_to_add),
+                ("roles_to_remove", roles_to_remove),
+                ("communication_disabled_until", communication_disabled_until),
+                ("voice_channel_id", voice_channel.id if voice_channel else None),
+            )
+            if value is not None
         }
 
-        for key, value in params.copy().items():
-            if value is None:
-                """
-                If a parameter has a value of None,
-                we don't want it in the dict because it could overwrite an already set parameter.
-                """
-                del params[key]
-
         data: dict[str, Any] = await self._state.http.edit_member(
             user, guild_id=self.guild.id, member=self, params=params
         )
@@ -21,9 +21,12 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Iterable
 
-from ..utils import Hashable, snowflake_time
+from asyncio import gather
+from types import MappingProxyType
+
+from ..utils import Hashable, snowflake_time, snowflake_timestamp
 from ..types import MessageReference
 from ..errors import Forbidden, NotFound
 
@@ -43,6 +46,30 @@ if TYPE_CHECKING:
     from .channel import DMChannel, TextChannel, ThreadChannel
     from .attachment import Attachment
 
+# Bound at module level so the snowflake conversions in the
+# per-message constructor hit the globals dict instead of
+# falling through to builtins.
+_int = int
+
+# Most messages never receive a reaction, so they all share one
+# read-only empty mapping instead of allocating a fresh dict each.
+# A real dict is swapped in on the first reaction add.
+_EMPTY_REACTIONS: MappingProxyType = MappingProxyType({})
+
+# Same idea for attachments: messages without any share one immutable
+# empty sequence instead of allocating a throwaway list each.
+_EMPTY_ATTACHMENTS: tuple = ()
+
+
+def _coerce_emoji(emoji: Emoji | str) -> str:
+    # Single isinstance dispatch shared by the reaction methods.
+    # Emoji.encode is cached on the Emoji itself, plain strings
+    # just get a possible <> wrapper stripped.
+    if isinstance(emoji, Emoji):
+        return emoji.encode
+
+    return emoji.strip("<>")
+
 
 class BaseMessage(Hashable):
     """
@@ -85,6 +112,8 @@ class BaseMessage(Hashable):
     __slots__ = (
         "_state",
         "_reactions",
+        "_reactions_cache",
+        "_created_at",
         "channel",
         "author",
         "type",
@@ -97,42 +126,87 @@ class BaseMessage(Hashable):
         "reference",
     )
 
+    # Overridden by GuildMessage; cheaper than probing for the
+    # guild slot with getattr on every edit.
+    _has_guild: bool = False
+
     def __init__(self, state: State, data: dict[str, Any]):
+        # Runs for every gateway message; bind the payload get once
+        # instead of a LOAD_METHOD per optional field.
+        get = data.get
+
         self._state: State = state
-        self._reactions: dict[int, MessageReaction] = {}
+        self._reactions: dict[int, MessageReaction] = _EMPTY_REACTIONS  # type: ignore
+        self._reactions_cache: list[MessageReaction] | None = None
+        self._created_at: datetime | None = None
 
         self.reference: MessageReference | None = None
         self.channel: DMChannel | TextChannel = data["channel"]
         self.author: DiscordUser | GuildMember = data["user_author"]
 
-        self.type: int | None = data.get("type")
-        self.id: int = int(data["id"])
+        self.type: int | None = get("type")
+        self.id: int = _int(data["id"])
         self.content: str = data["content"]
         self.pinned: bool = data["pinned"]
 
-        self.author_id: int = int(data["author"]["id"])
-        self.channel_id: int = int(data["channel_id"])
+        self.author_id: int = _int(data["author"]["id"])
+        self.channel_id: int = _int(data["channel_id"])
         self.tts: bool = data["tts"]
 
-        if reference := data.get("message_reference"):
+        if reference := get("message_reference"):
             self.reference = MessageReference(
-                channel_id=int(reference["channel_id"]),
-                message_id=int(reference["message_id"]),
+                channel_id=_int(reference["channel_id"]),
+                message_id=_int(reference["message_id"]),
             )
 
+    def __hash__(self) -> int:
+        # Messages are hashed and compared constantly by the caches,
+        # so identity goes straight through the id without the
+        # isinstance checks of the Hashable mixin.
+        return self.id
+
+    def __eq__(self, other: object) -> bool:
+        return self.__class__ is other.__class__ and self.id == other.id  # type: ignore
+
+    def __ne__(self, other: object) -> bool:
+        return self.__class__ is not other.__class__ or self.id != other.id  # type: ignore
+
     @property
     def created_at(self) -> datetime:
         """
         Datetime object of when the message was created.
         """
-        return snowflake_time(self.id)
+        # The id never changes, so the snowflake_time result
+        # is computed once and reused on later accesses.
+        if self._created_at is None:
+            self._created_at = snowflake_time(self.id)
+
+        return self._created_at
+
+    @property
+    def created_at_ts(self) -> float:
+        """
+        POSIX timestamp of when the message was created.
+
+        A cheap alternative to :attr:`created_at` for sorting or
+        comparing large batches of messages by time, as it skips
+        datetime construction entirely.
+
+        .. versionadded:: 1.2.0
+        """
+        return snowflake_timestamp(self.id)
 
     @property
     def reactions(self) -> list[MessageReaction]:
         """
         List with all message reactions.
         """
-        return list(self._reactions.values())
+        # Rebuilt lazily after _add_reaction / _remove_reaction,
+        # so repeated accesses don't allocate a fresh list.
+        if self._reactions_cache is None:
+            self._reactions_cache = list(self._reactions.values())
+
+        return self._reactions_cache
 
     def get_reaction(self, unique_id: int) -> MessageReaction | None:
         """
@@ -165,9 +239,6 @@ class BaseMessage(Hashable):
         Forbidden
             Selfbot doesn't have proper permissions.
         """
-        if isinstance(self, PrivateMessage) and user.id != self.author_id:
-            raise Forbidden("You can't delete someone private message.")
-
         await self._state.http.delete_message(user, self.channel_id, self.id)
 
     async def edit(
@@ -212,8 +283,8 @@ class BaseMessage(Hashable):
             content=content,
             attachments=attachments_data or None,
         )
-        if guild := getattr(self, "guild", None):
-            message_data["guild_id"] = guild.id
+        if self._has_guild:
+            message_data["guild_id"] = self.guild.id  # type: ignore
 
         message: GuildMessage | PrivateMessage | None = (
             await self._state.create_message_from_data(user=user, data=message_data)
@@ -245,16 +316,45 @@ class BaseMessage(Hashable):
         Forbidden
             Selfbot doesn't have proper permissions.
         """
-        if isinstance(emoji, str):
-            emoji = emoji.strip("<>")
-
         await self._state.http.create_reaction(
             user=user,
             channel_id=self.channel_id,
             message_id=self.id,
-            emoji=emoji.encode if isinstance(emoji, Emoji) else emoji,
+            emoji=_coerce_emoji(emoji),
         )
 
+    async def add_reactions(
+        self, user: SelfBot, emojis: Iterable[Emoji | str]
+    ) -> None:
+        """
+        Method to add multiple reactions to message.
+
+        The requests are issued concurrently, so the total wait is
+        bounded by the rate-limit bucket rather than one round-trip
+        per emoji.
+
+        .. versionadded:: 1.2.0
+
+        Parameters
+        ----------
+        user:
+            Selfbot to send request.
+        emojis:
+            Reaction emojis.
+
+        Raises
+        ------
+        HTTPTimeoutError
+            Request reached http timeout limit.
+        HTTPException
+            Adding reaction failed.
+        NotFound
+            Message not found.
+        Forbidden
+            Selfbot doesn't have proper permissions.
+        """
+        await gather(*(self.add_reaction(user, emoji) for emoji in emojis))
+
     async def remove_reaction(
         self, user: SelfBot, emoji: Emoji | str, member_id: int | None = None
     ) -> None:
@@ -281,17 +381,53 @@ class BaseMessage(Hashable):
         Forbidden
             Selfbot doesn't have proper permissions.
         """
-        if isinstance(emoji, str) and "<" in emoji:
-            emoji = emoji.strip("<>")
-
         await self._state.http.remove_reaction(
             user=user,
             channel_id=self.channel_id,
             message_id=self.id,
-            emoji=emoji.encode if isinstance(emoji, Emoji) else emoji,
+            emoji=_coerce_emoji(emoji),
             user_id=member_id or user.id,
         )
 
+    async def remove_reactions_by(
+        self,
+        user: SelfBot,
+        emojis: Iterable[Emoji | str],
+        member_id: int | None = None,
+    ) -> None:
+        """
+        Method to remove multiple reactions from message.
+
+        Like :meth:`add_reactions`, the requests run concurrently.
+        To clear every reaction in a single request use
+        :meth:`remove_reactions` instead.
+
+        .. versionadded:: 1.2.0
+
+        Parameters
+        ----------
+        user:
+            Selfbot to send request.
+        emojis:
+            Reaction emojis to remove.
+        member_id:
+            Reactions author id. If none, the id of the selfbot is considered.
+
+        Raises
+        ------
+        HTTPTimeoutError
+            Request reached http timeout limit.
+        HTTPException
+            Removing the reaction failed.
+        NotFound
+            Message or Reaction not found.
+        Forbidden
+            Selfbot doesn't have proper permissions.
+        """
+        await gather(
+            *(self.remove_reaction(user, emoji, member_id) for emoji in emojis)
+        )
+
     async def remove_reactions(self, user: SelfBot):
         """
         Method to remove all reaction from the message.
@@ -351,8 +487,7 @@ class BaseMessage(Hashable):
         attachments: list[dict[str, Any]] = []
 
         if files is not None:
-            async for attachment_data in self.channel._upload_files(user, files):
-                attachments.append(attachment_data)
+            attachments = await self.channel._upload_files(user, files)
 
         message_reference: MessageReference = MessageReference(
             channel_id=self.channel_id, message_id=self.id
@@ -398,14 +533,38 @@ class BaseMessage(Hashable):
             user=user, channel_id=self.channel_id, message_id=self.id
         )
 
+    def _inflate_contents(self, message_data: dict[str, Any]) -> None:
+        # Shared by both message subclasses; runs once per received
+        # message, so the class and method lookups are bound to locals
+        # before walking the raw payloads.
+        if reactions_data := message_data.get("reactions"):
+            reaction_cls = MessageReaction
+            self._reactions = {
+                reaction.unique_id: reaction
+                for reaction in (
+                    reaction_cls(message=self, data=reaction_data)
+                    for reaction_data in reactions_data
+                )
+            }
+
+        if attachments_data := message_data.get("attachments"):
+            self.attachments: list[Attachment] = self._state.create_attachments(
+                message=self, datas=attachments_data
+            )
+        else:
+            self.attachments = _EMPTY_ATTACHMENTS  # type: ignore
+
     def _add_reaction(self, reaction: MessageReaction) -> None:
+        if self._reactions is _EMPTY_REACTIONS:
+            self._reactions = {}
+
         self._reactions[reaction.unique_id] = reaction
+        self._reactions_cache = None
 
     def _remove_reaction(self, reaction: MessageReaction) -> None:
-        try:
-            del self._reactions[reaction.unique_id]
-        except ValueError:
-            pass
+        if self._reactions is not _EMPTY_REACTIONS:
+            self._reactions.pop(reaction.unique_id, None)
+            self._reactions_cache = None
 
 
 class PrivateMessage(BaseMessage):
@@ -451,25 +610,39 @@ class PrivateMessage(BaseMessage):
     def __init__(self, state: State, message_data: dict[str, Any]):
         super().__init__(state=state, data=message_data)
 
-        self.channel: DMChannel = message_data["channel"]
-        self.author: DiscordUser = message_data["user_author"]
-        self.attachments: list[Attachment] = []
-
-        for reaction_data in message_data.get("reactions", []):
-            reaction: MessageReaction[PrivateMessage] = MessageReaction(
-                message=self, data=reaction_data
-            )
-            self._reactions[reaction.unique_id] = reaction
-
-        for attachment_data in message_data.get("attachments", []):
-            attachment: Attachment[PrivateMessage] = self._state.create_attachment(
-                message=self, data=attachment_data
-            )
-            self.attachments.append(attachment)
+        # channel and author are already set by super().__init__;
+        # the narrowed types are documented in the class docstring.
+        self._inflate_contents(message_data)
 
     def __repr__(self) -> str:
         return f"<PrivateMessage(id={self.id}, author_id={self.author_id})>"
 
+    async def delete(self, user: SelfBot) -> None:
+        """
+        Method to delete message.
+
+        Parameters
+        ----------
+        user:
+            Selfbot to send request.
+
+        Raises
+        ------
+        HTTPTimeoutError
+            Request reached http timeout limit.
+        HTTPException
+            Deleting the message failed.
+        NotFound
+            Message not found.
+        Forbidden
+            You are trying to delete someone else's private message,
+            or the selfbot doesn't have proper permissions.
+        """
+        if user.id != self.author_id:
+            raise Forbidden("You can't delete someone private message.")
+
+        await super().delete(user)
+
     @property
     def reference_message(self) -> PrivateMessage | None:
         """
@@ -479,7 +652,7 @@ class PrivateMessage(BaseMessage):
         .. versionadded:: 1.2.0
         """
         if self.reference:
-            message = self.channel.get_message(int(self.reference["message_id"]))
+            message = self.channel.get_message(self.reference.message_id)
             if isinstance(message, PrivateMessage):
                 return message
 
@@ -526,25 +699,16 @@ class GuildMessage(BaseMessage):
 
     __slots__ = ("guild", "attachments")
 
+    _has_guild: bool = True
+
     def __init__(self, state: State, message_data: dict[str, Any]):
         super().__init__(state=state, data=message_data)
 
+        # channel and author are already set by super().__init__;
+        # the narrowed types are documented in the class docstring.
         self.guild: Guild = message_data["guild"]
-        self.channel: TextChannel | ThreadChannel = message_data["channel"]
-        self.author: GuildMember = message_data["user_author"]
-        self.attachments: list[Attachment] = []
-
-        for reaction_data in message_data.get("reactions", []):
-            reaction: MessageReaction[GuildMessage] = MessageReaction(
-                message=self, data=reaction_data
-            )
-            self._reactions[reaction.unique_id] = reaction
 
-        for attachment_data in message_data.get("attachments", []):
-            attachment: Attachment[GuildMessage] = self._state.create_attachment(
-                message=self, data=attachment_data
-            )
-            self.attachments.append(attachment)
+        self._inflate_contents(message_data)
 
     def __repr__(self) -> str:
         return f"<GuildMessage(id={self.id}, author_id={self.author_id})>"
@@ -558,7 +722,7 @@ class GuildMessage(BaseMessage):
         .. versionadded:: 1.2.0
         """
         if self.reference:
-            message = self.channel.get_message(int(self.reference["message_id"]))
+            message = self.channel.get_message(self.reference.message_id)
             if isinstance(message, GuildMessage):
                 return message
 
@@ -599,16 +763,18 @@ class GuildMessage(BaseMessage):
         if self.channel.type in (11, 12):
             raise Forbidden("You can't create thread from thread.")
 
+        # Unset fields are left out instead of building the full dict,
+        # copying it and pruning the Nones back out.
         payload: dict[str, Any] = {
-            "name": name,
-            "auto_archive_duration": auto_archive_duration,
-            "rate_limit_per_user": slowmode,
+            key: value
+            for key, value in (
+                ("name", name),
+                ("auto_archive_duration", auto_archive_duration),
+                ("rate_limit_per_user", slowmode),
+            )
+            if value is not None
         }
 
-        for key, value in payload.copy().items():
-            if value is None:
-                del payload[key]
-
         thread_data: dict[str, Any] = await self._state.http.start_thread_from_message(
             user=user, channel_id=self.channel_id, message_id=self.id, payload=payload
         )
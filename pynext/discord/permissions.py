@@ -23,10 +23,33 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 from typing import Iterable, Any
 
+from functools import reduce
+from operator import or_
+
 from ..errors import PynextError
 from ..enums import PermissionsFlags
 from .abc import BaseFlags
 
+# Flag/value pairs resolved once at import, so per-call enum iteration
+# doesn't pay the member and value descriptor lookups for every flag.
+_PERM_FLAG_ITEMS: tuple[tuple[PermissionsFlags, int], ...] = tuple(
+    (flag, flag.value) for flag in PermissionsFlags
+)
+
+# Bitmask with every known permission bit set.
+_ALL_MASK: int = reduce(or_, (bit for _, bit in _PERM_FLAG_ITEMS), 0)
+
+# Reverse lookup from a single permission bit to its flag.
+_BIT_TO_FLAG: dict[int, PermissionsFlags] = {
+    bit: flag for flag, bit in _PERM_FLAG_ITEMS
+}
+
+# Name lookup table; a plain dict probe is much cheaper than
+# going through EnumMeta.__getattr__ for every kwarg.
+_NAME_TO_FLAG: dict[str, PermissionsFlags] = {
+    flag.name: flag for flag, _ in _PERM_FLAG_ITEMS
+}
+
 
 class Permissions(BaseFlags):
     """
@@ -62,9 +85,7 @@ class Permissions(BaseFlags):
         self.permission_flags: dict[PermissionsFlags, bool] = {}
 
         for permission, status in permissions.items():
-            flag: PermissionsFlags | None = getattr(
-                PermissionsFlags, permission.upper(), None
-            )
+            flag: PermissionsFlags | None = _NAME_TO_FLAG.get(permission.upper())
 
             if not flag:
                 raise PynextError(f"Invalid permission: {permission}")
@@ -75,7 +96,9 @@ class Permissions(BaseFlags):
                 # If permission is enabled then this adds a bitwise value.
                 self.value = self.value | flag.value
 
-        self._flags: dict[PermissionsFlags, bool] = self.get_flags_by_value()
+        # Materialized lazily: most Permissions objects built from REST
+        # payloads only ever need .value, not the per-flag dict.
+        self._flags: dict[PermissionsFlags, bool] | None = None
 
     def __repr__(self) -> str:
         return f"<Permissions(key={self.get_bitwise_by_flags()})>"
@@ -87,18 +110,27 @@ class Permissions(BaseFlags):
         return not self.__eq__(other)
 
     def __hash__(self) -> int:
-        return hash((self.value, self._flags))
+        # The flag dict is a pure function of value, and hashing it
+        # would raise anyway since dicts aren't hashable.
+        return hash(self.value)
 
     def __iter__(self) -> Iterable[tuple[PermissionsFlags, bool]]:
-        for flag, status in self._flags.items():
-            yield flag, status
+        yield from self._get_flags().items()
+
+    def _get_flags(self) -> dict[PermissionsFlags, bool]:
+        if self._flags is None:
+            self._flags = self.get_flags_by_value()
+
+        return self._flags
 
     @classmethod
     def all(cls) -> Permissions:
         """
         Classmethod to create a permissions object with all permissions enabled.
         """
-        return Permissions(value=-1)
+        # An explicit mask instead of -1: same membership answers,
+        # without leaning on two's-complement & semantics.
+        return Permissions(value=_ALL_MASK)
 
     @classmethod
     def none(cls) -> Permissions:
@@ -118,7 +150,7 @@ class Permissions(BaseFlags):
         status:
             Flag status.
         """
-        self._flags[flag] = status
+        self._get_flags()[flag] = status
 
         if status is True:
             self.value = self.value | flag.value
@@ -127,20 +159,18 @@ class Permissions(BaseFlags):
         """
         Method to check what flags have status by bitwise value.
         """
-        flags: dict[PermissionsFlags, bool] = {}
-
-        for flag in PermissionsFlags:
-            if (self.value & flag.value) == flag.value:
-                flags[flag] = True
-            else:
-                flags[flag] = False
-
-        return flags
+        value: int = self.value
+        return {flag: (value & bit) == bit for flag, bit in _PERM_FLAG_ITEMS}
 
     def get_bitwise_by_flags(self) -> int:
         """
         Method to calculate the bitwise value of all flags.
         """
+        if self._flags is None:
+            # The flag dict would only mirror the bits of value,
+            # so the mask is the answer without materializing it.
+            return self.value & _ALL_MASK
+
         _value: int = 0
 
         for flag, status in self._flags.items():
@@ -158,19 +188,30 @@ class Permissions(BaseFlags):
         permissions:
             Another permissions object.
         """
-        old_flags: set = set(self._flags.items())
-        new_flags: set = set(permissions._flags.items())
-        flags_to_update: dict[PermissionsFlags, bool] = dict(new_flags - old_flags)
+        flags: dict[PermissionsFlags, bool] = self._get_flags()
+        new_value: int = permissions.get_bitwise_by_flags()
+
+        # The differing flags are exactly the set bits of the XOR,
+        # so only those are walked instead of diffing item sets.
+        diff: int = self.get_bitwise_by_flags() ^ new_value
+
+        while diff:
+            bit: int = diff & -diff
+            diff ^= bit
+
+            flag: PermissionsFlags | None = _BIT_TO_FLAG.get(bit)
+            if flag is None:
+                continue
 
-        for key, value in flags_to_update.items():
-            if key in permissions.permission_flags:
-                self._flags[key] = value
+            status: bool = (new_value & bit) == bit
+            if flag in permissions.permission_flags:
+                flags[flag] = status
             else:
                 # if we have a permissions flag to update,
                 # which we have not entered in the permissions argument,
                 # we want to set its parameter it already has
                 # so if key to change is False it means the flag had a key True
-                self._flags[key] = value is False
+                flags[flag] = status is False
 
         return self
 
@@ -201,54 +242,41 @@ class PermissionOverwrite:
         Permissions with statuses. Use None to set permission to default value.
     """
 
-    __slots__ = ("_allow", "_deny")
+    __slots__ = ("_allow_value", "_deny_value")
 
     def __init__(self, **permissions: bool | None):
-        self._allow: dict[PermissionsFlags, bool] = {}
-        self._deny: dict[PermissionsFlags, bool] = {}
+        # Only the two bitmasks are stored; Permissions views are
+        # constructed from them on demand.
+        self._allow_value: int = 0
+        self._deny_value: int = 0
 
         for permission, status in permissions.items():
-            flag: PermissionsFlags | None = getattr(
-                PermissionsFlags, permission.upper(), None
-            )
+            flag: PermissionsFlags | None = _NAME_TO_FLAG.get(permission.upper())
 
             if not flag:
                 raise PynextError(f"Invalid permission type: {permission}")
 
             if status is False:
-                self._deny[flag] = True
+                self._deny_value |= flag.value
             elif status is True:
-                self._allow[flag] = True
+                self._allow_value |= flag.value
 
     def __repr__(self) -> str:
-        allow: int = self.get_bitwise_by_flags(self._allow)
-        deny: int = self.get_bitwise_by_flags(self._deny)
-
-        return f"<PermissionOverwrite(allow={allow} deny={deny})>"
+        return f"<PermissionOverwrite(allow={self._allow_value} deny={self._deny_value})>"
 
     @property
     def allow(self) -> Permissions:
         """
         Permission object only with allowed flags.
         """
-        allow: Permissions = Permissions()
-
-        for perm, status in self._allow.items():
-            allow.add_flag(perm, status)
-
-        return allow
+        return Permissions(value=self._allow_value)
 
     @property
     def deny(self) -> Permissions:
         """
         Permission object only with not allowed flags.
         """
-        deny: Permissions = Permissions()
-
-        for perm, status in self._deny.items():
-            deny.add_flag(perm, status)
-
-        return deny
+        return Permissions(value=self._deny_value)
 
     def pair(self) -> tuple[Permissions, Permissions]:
         """
@@ -286,14 +314,14 @@ class PermissionOverwrite:
         deny:
             Bitwise value of not allowed permissions.
         """
-        allow_permissions: Permissions = Permissions(value=allow)
-        deny_permissions: Permissions = Permissions(value=deny)
+        overwrite: PermissionOverwrite = cls()
 
-        allow_flags = set(allow_permissions.flags.items())
-        deny_flags = set(deny_permissions.flags.items())
-        flags: dict = dict(allow_flags - deny_flags)
+        # Bits claimed by both sides cancel out, matching the old
+        # item-set difference, without the kwargs round-trip.
+        overwrite._allow_value = allow & ~deny & _ALL_MASK
+        overwrite._deny_value = deny & ~allow & _ALL_MASK
 
-        return cls(**{flag.name: status for flag, status in flags.items()})
+        return overwrite
 
     @classmethod
     def make_from_permissions(
@@ -31,6 +31,10 @@ from ..errors import PynextError
 if TYPE_CHECKING:
     from .activity import Activity
 
+# Resolved once at import; skips the enum descriptor lookup on every
+# presence payload build.
+_OP_PRESENCE: int = GatewayCodes.PRESENCE.value
+
 
 class PresenceBuilder:
     """
@@ -64,7 +68,16 @@ class PresenceBuilder:
         Invalid status type. Expected str or StatusType.
     """
 
-    __slots__ = ("status", "since", "afk", "activities")
+    __slots__ = (
+        "status",
+        "since",
+        "afk",
+        "activities",
+        "_hash",
+        "_activities_cache",
+        "_version",
+        "_cache_version",
+    )
 
     def __init__(
         self,
@@ -74,7 +87,9 @@ class PresenceBuilder:
         since: int | None = None,
         activities: list[Activity] | None = None,
     ):
-        self.activities: list[Activity] = activities or []
+        # Explicit None checks: `or` would replace a caller-provided
+        # empty list and treat since=0 as missing.
+        self.activities: list[Activity] = [] if activities is None else activities
 
         if isinstance(status, StatusType):
             status = status.value
@@ -85,21 +100,37 @@ class PresenceBuilder:
             )
 
         self.status = status
-        self.since: int = since or int(time())
+        self.since: int = int(time()) if since is None else since
         self.afk: bool = afk
+        self._hash: int | None = None
+        self._activities_cache: list[dict[str, Any]] | None = None
+
+        # Bumped by the mutator methods; to_dict rebuilds the cached
+        # activities list when it lags behind.
+        self._version: int = 0
+        self._cache_version: int = -1
 
     def __repr__(self) -> str:
         return f"<PresenceBuilder(status={self.status})>"
 
     def __hash__(self) -> int:
-        return hash((self.status, self.afk, self.since, self.activities))
+        # Memoized: builders are effectively immutable once sent, and
+        # hashing the activities list directly would raise TypeError.
+        if self._hash is None:
+            self._hash = hash(
+                (self.status, self.afk, self.since, tuple(self.activities))
+            )
+
+        return self._hash
 
     def __eq__(self, other: object) -> bool:
-        return isinstance(other, self.__class__) and other.unique_id == self.unique_id
+        return self is other or (
+            isinstance(other, self.__class__) and hash(other) == hash(self)
+        )
 
     def __ne__(self, other: object) -> bool:
         if isinstance(other, self.__class__):
-            return other.unique_id != self.unique_id
+            return hash(other) != hash(self)
         return True
 
     @property
@@ -109,15 +140,54 @@ class PresenceBuilder:
         """
         return self.__hash__()
 
+    def add_activity(self, activity: Activity) -> None:
+        """
+        Method to add an activity to the builder.
+
+        .. versionadded:: 1.2.0
+
+        Parameters
+        ----------
+        activity:
+            Activity to add.
+        """
+        self.activities.append(activity)
+        self._version += 1
+
+    def clear_activities(self) -> None:
+        """
+        Method to remove all activities from the builder.
+
+        .. versionadded:: 1.2.0
+        """
+        self.activities.clear()
+        self._version += 1
+
     def to_dict(self) -> dict[str, Any]:
         """
         Method to format all data into a dict.
         """
+        # Presence updates resend the same builder repeatedly, so the
+        # serialized activities are reused until the builder changes:
+        # the mutator methods bump _version, and an activity edited
+        # in place drops its own cached dict, which the probe catches.
+        if (
+            self._cache_version != self._version
+            or self._activities_cache is None
+            or any(
+                activity._cached_dict is None for activity in self.activities
+            )
+        ):
+            self._activities_cache = [
+                activity.to_dict() for activity in self.activities
+            ]
+            self._cache_version = self._version
+
         return {
-            "op": GatewayCodes.PRESENCE.value,
+            "op": _OP_PRESENCE,
             "d": {
                 "since": self.since,
-                "activities": [activity.to_dict() for activity in self.activities],
+                "activities": self._activities_cache,
                 "status": self.status,
                 "afk": self.afk,
             },
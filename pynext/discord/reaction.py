@@ -56,7 +56,7 @@ class MessageReaction(Generic[MessageT]):
         Reaction author id.
     """
 
-    __slots__ = ("message", "emoji", "guild", "author_id")
+    __slots__ = ("message", "emoji", "guild", "author_id", "_hash")
 
     def __init__(self, message: MessageT, data: dict[str, Any]) -> None:
         emoji_data: dict[str, Any] = data["emoji"]
@@ -74,20 +74,33 @@ class MessageReaction(Generic[MessageT]):
         else:
             self.author_id: int | None = None
 
+        # Every field is fixed after construction, so the hash is
+        # computed once instead of allocating a tuple per lookup.
+        self._hash: int = hash(
+            (
+                message.id,
+                self.emoji.unique_id,
+                self.guild.id if self.guild else 0,
+                self.author_id or 0,
+            )
+        )
+
     def __repr__(self) -> str:
         return (
             f"<MessageReaction(message_id={self.message.id}, emoji={self.emoji.name})>"
         )
 
     def __hash__(self) -> int:
-        return hash((self.message.id, self.emoji.unique_id, self.guild, self.author_id))
+        return self._hash
 
     def __eq__(self, other: object) -> bool:
-        return isinstance(other, self.__class__) and other.unique_id == self.unique_id
+        return self is other or (
+            isinstance(other, self.__class__) and other._hash == self._hash
+        )
 
     def __ne__(self, other: object) -> bool:
         if isinstance(other, self.__class__):
-            return other.unique_id != self.unique_id
+            return other._hash != self._hash
         return True
 
     @property
@@ -95,7 +108,7 @@ class MessageReaction(Generic[MessageT]):
         """
         Unique id of message reaction.
         """
-        return self.__hash__()
+        return self._hash
 
     async def users(self, user: SelfBot) -> AsyncIterable[GuildMember | DiscordUser]:
         """
@@ -124,15 +137,21 @@ class MessageReaction(Generic[MessageT]):
             emoji=self.emoji.encode,
         )
 
-        for user_data in data:
-            if self.guild is None:
-                member = user.state.create_user(data=user_data)
-            else:
-                member = user.state.create_guild_member(
-                    guild=self.guild, data=user_data
-                )
-                self.guild._add_member(member)
-            yield member
+        # The guild check is loop-invariant, so each branch runs its
+        # own tight loop with the factory bound once.
+        guild: Guild | None = self.guild
+
+        if guild is None:
+            create_user = user.state.create_user
+            for user_data in data:
+                yield create_user(data=user_data)
+        else:
+            create_guild_member = user.state.create_guild_member
+            add_member = guild._add_member
+            for user_data in data:
+                member = create_guild_member(guild=guild, data=user_data)
+                add_member(member)
+                yield member
 
     async def remove(self, user: SelfBot, member_id: int | None = None) -> None:
         """
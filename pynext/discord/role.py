@@ -24,6 +24,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from datetime import datetime
+from operator import itemgetter
 
 from ..utils import Hashable, snowflake_time
 from .permissions import Permissions
@@ -33,6 +34,12 @@ if TYPE_CHECKING:
     from ..selfbot import SelfBot
     from .guild import Guild
 
+# Single C-level extraction of the required payload fields, instead of
+# one bytecode-dispatched dict lookup per attribute in __init__.
+_role_fields = itemgetter(
+    "id", "name", "managed", "position", "hoist", "mentionable", "color", "permissions"
+)
+
 
 class Role(Hashable):
     """
@@ -79,20 +86,35 @@ class Role(Hashable):
         "guild",
         "color",
         "permissions",
+        "_created_at",
+        "_guild_id",
     )
 
     def __init__(self, guild: Guild, data: dict[str, Any]):
+        (
+            role_id,
+            name,
+            managed,
+            position,
+            hoist,
+            mentionable,
+            color,
+            permissions,
+        ) = _role_fields(data)
+
         self.guild: Guild = guild
-        self.permissions: Permissions = Permissions(value=int(data["permissions"]))
+        self._guild_id: int = guild.id
+        self.permissions: Permissions = Permissions(value=int(permissions))
+        self._created_at: datetime | None = None
 
-        self.id: int = int(data["id"])
-        self.name: str = data["name"]
-        self.managed: bool = data["managed"]
+        self.id: int = int(role_id)
+        self.name: str = name
+        self.managed: bool = managed
 
-        self.position: int = data["position"]
-        self.hoist: bool = data["hoist"]
-        self.mentionable: bool = data["mentionable"]
-        self.color: Color = Color(data["color"])
+        self.position: int = position
+        self.hoist: bool = hoist
+        self.mentionable: bool = mentionable
+        self.color: Color = Color(color)
 
     def __repr__(self) -> str:
         return f"<Role(name={self.name}, id={self.id})>"
@@ -102,7 +124,12 @@ class Role(Hashable):
         """
         Datetime object of when the role was created.
         """
-        return snowflake_time(self.id)
+        # Memoized in a slot; the id never changes, so the datetime
+        # doesn't have to be rebuilt on every access.
+        if self._created_at is None:
+            self._created_at = snowflake_time(self.id)
+
+        return self._created_at
 
     @property
     def mention(self) -> str:
@@ -118,7 +145,9 @@ class Role(Hashable):
         """
         Method to check if role is default (@everyone).
         """
-        return self.guild.id == self.id
+        # Compares against the id cached at construction; mention hits
+        # this on every render, so the guild dereference is skipped.
+        return self._guild_id == self.id
 
     async def delete(self, user: SelfBot) -> None:
         """
@@ -180,22 +209,20 @@ class Role(Hashable):
         Forbidden
             Selfbot doesn't have proper permissions.
         """
+        # Parameters with a value of None are left out of the dict,
+        # because they could overwrite an already set parameter.
         params: dict[str, Any] = {
-            "name": name,
-            "permissions": permissions,
-            "color": color.value if color else None,
-            "hoist": hoist,
-            "mentionable": mentionable,
+            key: value
+            for key, value in (
+                ("name", name),
+                ("permissions", permissions),
+                ("color", color.value if color else None),
+                ("hoist", hoist),
+                ("mentionable", mentionable),
+            )
+            if value is not None
         }
 
-        for key, value in params.copy().items():
-            if value is None:
-                """
-                If a parameter has a value of None,
-                we don't want it in the dict because it could overwrite an already set parameter.
-                """
-                del params[key]
-
         data: dict[str, Any] = await user.http.edit_role(
             user, guild_id=self.guild.id, role=self, params=params
         )
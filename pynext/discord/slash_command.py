@@ -23,6 +23,8 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
+from operator import itemgetter
+
 from ..utils import Hashable, snowflake_time, create_session
 from ..enums import CommandOptionType
 from ..errors import UnSupportedOptionType
@@ -41,6 +43,52 @@ if TYPE_CHECKING:
 
     from .application import Application
 
+# Exact-type dispatch for the common primitive option values; a single
+# dict probe instead of walking the isinstance chain per argument.
+# bool is listed on its own, so it can't fall into the int bucket.
+# Raw enum ints are stored, so the callers building wire payloads
+# skip the .value descriptor lookup per parameter as well.
+_OPTION_TYPE_MAP: dict[type, int] = {
+    str: CommandOptionType.STRING.value,
+    bool: CommandOptionType.BOOLEAN.value,
+    int: CommandOptionType.INTEGER.value,
+    float: CommandOptionType.NUMBER.value,
+}
+
+# Single C-level extraction of the required payload fields; only the
+# optional description stays on data.get.
+_command_fields = itemgetter("name", "id", "type", "version")
+
+# Shared empty sentinel; most commands have no plain options, so they
+# all point at the same immutable tuple instead of one list each.
+_EMPTY_OPTIONS: tuple = ()
+
+
+def _get_option_type(value: Any) -> tuple[int, Any]:
+    # Module-level so the hot loops skip the descriptor lookup through
+    # the class; BaseCommand keeps a staticmethod alias for callers.
+    option_type: int | None = _OPTION_TYPE_MAP.get(type(value))
+    if option_type is not None:
+        return option_type, value
+
+    # Fallback for subclasses and the discord object types.
+    if isinstance(value, str):
+        return CommandOptionType.STRING.value, value
+    if isinstance(value, bool):
+        return CommandOptionType.BOOLEAN.value, value
+    if isinstance(value, int):
+        return CommandOptionType.INTEGER.value, value
+    if isinstance(value, float):
+        return CommandOptionType.NUMBER.value, value
+    if isinstance(value, Role):
+        return CommandOptionType.ROLE.value, value.id
+    if isinstance(value, DiscordUser):
+        return CommandOptionType.USER.value, value.id
+    if isinstance(value, BaseChannel):
+        return CommandOptionType.CHANNEL.value, value.id
+
+    raise UnSupportedOptionType(f"Command does not support {type(value)} value type.")
+
 
 class BaseCommand(Hashable):
     """
@@ -65,30 +113,67 @@ class BaseCommand(Hashable):
         Autoincrementing version identifier updated during substantial record changes.
     """
 
-    __slots__ = ("name", "description", "id", "type", "version_id", "_sub_commands")
+    __slots__ = (
+        "name",
+        "description",
+        "id",
+        "type",
+        "version_id",
+        "_sub_commands",
+        "_sub_commands_cache",
+        "_created_at",
+        "_base_data",
+    )
 
     def __init__(self, data: dict[str, Any]):
-        self.name: str = data["name"]
+        name, command_id, command_type, version = _command_fields(data)
+
+        self.name: str = name
         self.description: str | None = data.get("description")
-        self.id: int = int(data["id"])
-        self.type: int = int(data["type"])
-        self.version_id: int = int(data["version"])
+        self.id: int = int(command_id)
+        self.type: int = int(command_type)
+        self.version_id: int = int(version)
+
+        # Wire form of the invariant fields, built once; to_dict and
+        # the invocation payloads copy it instead of re-stringifying
+        # the ids on every call.
+        self._base_data: dict[str, Any] = {
+            "id": str(command_id),
+            "version": str(version),
+            "name": name,
+            "type": self.type,
+        }
 
-        self._sub_commands: dict[str, SubCommand] = {}
+        # Created lazily; most leaf commands never get children.
+        self._sub_commands: dict[str, SubCommand] | None = None
+        self._sub_commands_cache: list[SubCommand] | None = None
+        self._created_at: datetime | None = None
 
     @property
     def created_at(self) -> datetime:
         """
         Datetime object of when the command was created.
         """
-        return snowflake_time(self.id)
+        # Memoized in a slot; the id never changes, so the datetime
+        # doesn't have to be rebuilt on every access.
+        if self._created_at is None:
+            self._created_at = snowflake_time(self.id)
+
+        return self._created_at
 
     @property
     def sub_commands(self) -> list[SubCommand]:
         """
         Command subcommands
         """
-        return list(self._sub_commands.values())
+        # Materialized once and rebuilt only after the sub-command
+        # dict changes, so repeated iteration doesn't allocate.
+        if self._sub_commands_cache is None:
+            self._sub_commands_cache = (
+                [] if self._sub_commands is None else list(self._sub_commands.values())
+            )
+
+        return self._sub_commands_cache
 
     def get_sub_command(self, name: str) -> SubCommand | None:
         """
@@ -99,48 +184,31 @@ class BaseCommand(Hashable):
         name:
             Subcommand name.
         """
+        if self._sub_commands is None:
+            return None
+
         return self._sub_commands.get(name)
 
     def to_dict(self) -> dict[str, Any]:
         """
         Method to convert class attributes to dict.
         """
-        return {
-            "id": str(self.id),
-            "version": str(self.version_id),
-            "name": self.name,
-            "type": self.type,
-        }
+        # Copied so callers can't mutate the cached skeleton.
+        return self._base_data.copy()
 
     def _add_sub_command(self, subcommand: SubCommand) -> None:
+        if self._sub_commands is None:
+            self._sub_commands = {}
+
         self._sub_commands[subcommand.name] = subcommand
+        self._sub_commands_cache = None
 
     def _remove_sub_command(self, name: str) -> None:
-        try:
-            del self._sub_commands[name]
-        except KeyError:
-            pass
-
-    @staticmethod
-    def _get_option_type(value: Any) -> tuple[CommandOptionType, Any]:
-        if isinstance(value, str):
-            return CommandOptionType.STRING, value
-        if isinstance(value, bool):
-            return CommandOptionType.BOOLEAN, value
-        if isinstance(value, int):
-            return CommandOptionType.INTEGER, value
-        if isinstance(value, float):
-            return CommandOptionType.NUMBER, value
-        if isinstance(value, Role):
-            return CommandOptionType.ROLE, value.id
-        if isinstance(value, DiscordUser):
-            return CommandOptionType.USER, value.id
-        if isinstance(value, BaseChannel):
-            return CommandOptionType.CHANNEL, value.id
-
-        raise UnSupportedOptionType(
-            f"Command does not support {type(value)} value type."
-        )
+        if self._sub_commands is not None:
+            self._sub_commands.pop(name, None)
+            self._sub_commands_cache = None
+
+    _get_option_type = staticmethod(_get_option_type)
 
 
 class SlashCommand(BaseCommand):
@@ -181,34 +249,52 @@ class SlashCommand(BaseCommand):
         "application",
         "options",
         "default_member_permissions",
+        "_version",
+        "_payload_template",
     )
 
     def __init__(self, application: Application, data: dict[str, Any]):
         super().__init__(data)
         self._state: State = application._state
+        self._version: datetime | None = None
 
         self.application: Application = application
-        self.options: list[ApplicationCommandOption] = []
+
+        # Invariant part of the interaction payload, shallow-copied
+        # per use() call. guild_id stays per-call: it depends on the
+        # channel the command is invoked on.
+        self._payload_template: dict[str, Any] = {
+            "type": 2,
+            "application_id": str(application.id),
+        }
         self.default_member_permissions: Permissions | None = None
 
         if permissions := data.get("default_member_permissions"):
             self.default_member_permissions = Permissions(int(permissions))
 
-        for option_data in data.get("options", []):
-            if option_data["type"] in (1, 2):
-                self._add_sub_command(
-                    self._state.create_sub_command(parent=self, data=option_data)
-                )
-            else:
-                self.options.append(
-                    ApplicationCommandOption(
-                        type=option_data["type"],
-                        name=option_data["name"],
-                        description=option_data["description"],
-                        required=option_data.get("required", False),
-                        autocomplete=option_data.get("autocomplete", False),
+        self.options: list[ApplicationCommandOption] = _EMPTY_OPTIONS  # type: ignore
+
+        if options_data := data.get("options"):
+            for option_data in options_data:
+                if option_data["type"] in (1, 2):
+                    self._add_sub_command(
+                        self._state.create_sub_command(parent=self, data=option_data)
                     )
+
+            # Local binding + list comprehension keeps the option parsing
+            # in a single C-level loop instead of repeated .append calls.
+            option_cls = ApplicationCommandOption
+            self.options = [
+                option_cls(
+                    type=option_data["type"],
+                    name=option_data["name"],
+                    description=option_data["description"],
+                    required=option_data.get("required", False),
+                    autocomplete=option_data.get("autocomplete", False),
                 )
+                for option_data in options_data
+                if option_data["type"] not in (1, 2)
+            ]
 
     def __repr__(self) -> str:
         return f"<SlashCommand(name={self.name}, id={self.id})>"
@@ -218,7 +304,10 @@ class SlashCommand(BaseCommand):
         """
         Datetime object of autoincrementing version updated during substantial record changes.
         """
-        return snowflake_time(self.version_id)
+        if self._version is None:
+            self._version = snowflake_time(self.version_id)
+
+        return self._version
 
     async def use(
         self, user: SelfBot, channel: TextChannel | DMChannel, **params
@@ -248,22 +337,18 @@ class SlashCommand(BaseCommand):
         UnSupportedOptionType
             Command does not support the specified option type.
         """
+        get_option_type = self._get_option_type
         command_params: list[dict[str, Any]] = []
+        append = command_params.append
 
         for key, value in params.items():
-            value_type, value = self._get_option_type(value)
-
-            command_params.append(
-                {"name": key, "value": value, "type": value_type.value}
-            )
+            value_type, value = get_option_type(value)
+            append({"name": key, "value": value, "type": value_type})
 
-        payload: dict[str, Any] = {
-            "type": 2,
-            "application_id": str(self.application.id),
-            "channel_id": str(channel.id),
-            "session_id": create_session(),
-            "data": {**self.to_dict(), "options": command_params},
-        }
+        payload: dict[str, Any] = self._payload_template.copy()
+        payload["channel_id"] = str(channel.id)
+        payload["session_id"] = user._session_id or create_session()
+        payload["data"] = {**self._base_data, "options": command_params}
 
         if isinstance(channel, TextChannel):
             payload["guild_id"] = channel.guild.id
@@ -304,7 +389,14 @@ class SubCommand(BaseCommand):
         Autoincrementing version identifier updated during substantial record changes.
     """
 
-    __slots__ = ("_state", "application", "options", "parent")
+    __slots__ = (
+        "_state",
+        "application",
+        "options",
+        "parent",
+        "_payload_template",
+        "_ancestry",
+    )
 
     def __init__(self, parent: SlashCommand | SubCommand, data: dict[str, Any]):
         super().__init__(data)
@@ -313,23 +405,43 @@ class SubCommand(BaseCommand):
 
         self.parent: SlashCommand | SubCommand = parent
         self.application: Application = parent.application
-        self.options: list[ApplicationCommandOption] = []
+        self._payload_template: dict[str, Any] = {
+            "type": 2,
+            "application_id": str(self.application.id),
+        }
 
-        for option_data in data.get("options", []):
-            if option_data["type"] == 1:
-                self._add_sub_command(
-                    self._state.create_sub_command(parent=self, data=option_data)
-                )
-            else:
-                self.options.append(
-                    ApplicationCommandOption(
-                        type=option_data["type"],
-                        name=option_data["name"],
-                        description=option_data["description"],
-                        required=option_data.get("required", False),
-                        autocomplete=option_data.get("autocomplete", False),
+        # Root-first command chain, fixed at construction. Parents are
+        # always built before their children, so the parent's cached
+        # chain can be extended instead of re-walking on every use().
+        if isinstance(parent, SubCommand):
+            self._ancestry: tuple[SlashCommand | SubCommand, ...] = (
+                *parent._ancestry,
+                self,
+            )
+        else:
+            self._ancestry = (parent, self)
+
+        self.options: list[ApplicationCommandOption] = _EMPTY_OPTIONS  # type: ignore
+
+        if options_data := data.get("options"):
+            for option_data in options_data:
+                if option_data["type"] == 1:
+                    self._add_sub_command(
+                        self._state.create_sub_command(parent=self, data=option_data)
                     )
+
+            option_cls = ApplicationCommandOption
+            self.options = [
+                option_cls(
+                    type=option_data["type"],
+                    name=option_data["name"],
+                    description=option_data["description"],
+                    required=option_data.get("required", False),
+                    autocomplete=option_data.get("autocomplete", False),
                 )
+                for option_data in options_data
+                if option_data["type"] != 1
+            ]
 
     def __repr__(self) -> str:
         return f"<SubCommand(name={self.name}, id={self.id})>"
@@ -362,61 +474,43 @@ class SubCommand(BaseCommand):
         UnSupportedOptionType
             Command does not support the specified option type.
         """
-        payload: dict[str, Any] = {
-            "type": 2,
-            "application_id": str(self.application.id),
-            "channel_id": str(channel.id),
-            "session_id": create_session(),
-            "data": self.__format_options_payload(params),
-        }
+        payload: dict[str, Any] = self._payload_template.copy()
+        payload["channel_id"] = str(channel.id)
+        payload["session_id"] = user._session_id or create_session()
+        payload["data"] = self.__format_options_payload(params)
+
         if isinstance(channel, TextChannel):
             payload["guild_id"] = channel.guild.id
 
         await self._state.http.use_interaction(user=user, payload=payload)
 
     def __format_options_payload(self, params: dict[str, Any]) -> dict[str, Any]:
-        # Don't ask what's going on here. It just works.
-
-        slash_command: SubCommand | SlashCommand = self
-        sub_commands: list[SubCommand | SlashCommand] = [slash_command]
-
-        while True:
-            sub_commands.append(slash_command.parent)
-            slash_command = slash_command.parent
-
-            if isinstance(slash_command, SlashCommand):
-                break
-
-        options: dict[str, Any] = {}
-
-        for index, cmd in enumerate(reversed(sub_commands)):
-            if index == 0:
-                options = {
-                    "type": 1,
-                    "name": cmd.name,
-                    "id": cmd.id,
-                    "version": cmd.version_id,
-                    "options": [{}],
-                }
-            else:
-                data: dict[str, Any] = options
-                for _ in range(index):
-                    data = data["options"][0]
-
-                data["type"] = cmd.type
-                data["name"] = cmd.name
-                data["options"] = [{}]
-
-                if index == len(sub_commands) - 1:
-                    command_params: list[dict[str, Any]] = []
+        # Each level wraps the next command in its options list and the
+        # invoked leaf carries the encoded params. The dicts are built
+        # per call on purpose: the payload is handed to the http layer
+        # and must not alias a shared template.
+        root, *descendants = self._ancestry
+
+        options: dict[str, Any] = {
+            "type": 1,
+            "name": root.name,
+            "id": root.id,
+            "version": root.version_id,
+        }
 
-                    for key, value in params.items():
-                        value_type, value = self._get_option_type(value)
+        level: dict[str, Any] = options
+        for cmd in descendants:
+            next_level: dict[str, Any] = {"type": cmd.type, "name": cmd.name}
+            level["options"] = [next_level]
+            level = next_level
 
-                        command_params.append(
-                            {"name": key, "value": value, "type": value_type.value}
-                        )
+        get_option_type = self._get_option_type
+        command_params: list[dict[str, Any]] = []
+        append = command_params.append
 
-                    data["options"] = command_params
+        for key, value in params.items():
+            value_type, value = get_option_type(value)
+            append({"name": key, "value": value, "type": value_type})
 
+        level["options"] = command_params
         return options
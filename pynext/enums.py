@@ -20,10 +20,10 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
 FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
-from enum import Enum
+from enum import Enum, IntEnum
 
 
-class ChannelType(Enum):
+class ChannelType(IntEnum):
     """
     Discord channel types.
     """
@@ -38,7 +38,7 @@ class ChannelType(Enum):
     GUILD_ANNOUNCEMENT = 5
 
 
-class VideoQuality(Enum):
+class VideoQuality(IntEnum):
     """
     Discord video qualities.
     """
@@ -47,7 +47,7 @@ class VideoQuality(Enum):
     FULL = 2
 
 
-class PermissionsFlags(Enum):
+class PermissionsFlags(IntEnum):
     """
     Discord permissions flags.
     """
@@ -87,7 +87,7 @@ class PermissionsFlags(Enum):
     MODERATE_MEMBERS = 1 << 40
 
 
-class GatewayCodes(Enum):
+class GatewayCodes(IntEnum):
     """
     Discord gateway opcodes.
     """
@@ -180,7 +180,7 @@ class StatusType(Enum):
     OFFLINE = "offline"
 
 
-class ActivityType(Enum):
+class ActivityType(IntEnum):
     """
     Discord activity types.
     """
@@ -192,7 +192,7 @@ class ActivityType(Enum):
     COMPETING = 5
 
 
-class CommandOptionType(Enum):
+class CommandOptionType(IntEnum):
     """
     Discord command option types.
     """
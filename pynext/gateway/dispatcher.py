@@ -34,7 +34,6 @@ from typing import (
 
 from logging import Logger, getLogger
 from asyncio import iscoroutinefunction, get_event_loop, Future
-from collections import defaultdict
 
 from ..utils import maybe_coro
 from ..errors import FunctionIsNotCoroutine
@@ -47,6 +46,20 @@ if TYPE_CHECKING:
 
 ObjectT = TypeVar("ObjectT", bound=object)
 
+# Bounded by the set of event names ever dispatched (~a few dozen);
+# a dict hit is cheaper than str.lower, which allocates a new string
+# even when the input is already lowercase.
+_LOWER_CACHE: dict[str, str] = {}
+
+
+def _lower_name(event_name: str) -> str:
+    lower: str | None = _LOWER_CACHE.get(event_name)
+
+    if lower is None:
+        lower = _LOWER_CACHE[event_name] = event_name.lower()
+
+    return lower
+
 
 class Dispatcher(Generic[ObjectT]):
     """
@@ -70,7 +83,14 @@ class Dispatcher(Generic[ObjectT]):
         Logger for logging event registrations and running them.
     """
 
-    __slots__ = ("client", "loop", "events", "logger", "_wait_for_futures")
+    __slots__ = (
+        "client",
+        "loop",
+        "events",
+        "logger",
+        "_wait_for_futures",
+        "_resolved_handlers",
+    )
 
     def __init__(self, client: ObjectT | None = None) -> None:
         self.client: ObjectT | None = client
@@ -78,9 +98,17 @@ class Dispatcher(Generic[ObjectT]):
 
         self.events: dict[str, Callable[..., Coroutine]] = {}
         self.logger: Logger = getLogger("pynext.gateway")
-        self._wait_for_futures: dict[
-            str, list[tuple[Future, WaitForCheck | None]]
-        ] = defaultdict(list)
+
+        # Keyed by future (hashable and unique), so resolving a waiter
+        # is an O(1) pop instead of a linear tuple-comparing scan.
+        # Plain dict: dispatch probes it with .get() on every event, and
+        # buckets are only created in wait_for, so defaultdict would just
+        # add __missing__ machinery without being exercised.
+        self._wait_for_futures: dict[str, dict[Future, WaitForCheck | None]] = {}
+
+        # Per-event handler tuples, resolved lazily. Invalidated by
+        # register(); the client object is fixed at construction.
+        self._resolved_handlers: dict[str, tuple[Callable[..., Coroutine], ...]] = {}
 
     def __repr__(self) -> str:
         return f"<Dispatcher(events={len(self.events)})>"
@@ -132,6 +160,7 @@ class Dispatcher(Generic[ObjectT]):
             )
 
         self.events[event_name] = function
+        self._resolved_handlers.pop(event_name, None)
         self.logger.debug(f"Dispatcher registered new event: {event_name}.")
 
     def dispatch(self, event_name: str, *args: Any, **kwargs: Any) -> None:
@@ -147,21 +176,59 @@ class Dispatcher(Generic[ObjectT]):
         kwargs:
             Event kwargs.
         """
-        event_name = event_name.lower()
-        for future, check in self._wait_for_futures.get(event_name, []):
-            self.logger.debug(f"Dispatching an wait_for: {event_name}.")
-
-            self.loop.create_task(
-                self._run_future(event_name, future, check, *args, **kwargs)
+        event_name = _lower_name(event_name)
+        if waiters := self._wait_for_futures.get(event_name):
+            resolved: list[Future] = []
+
+            # Snapshot: the scheduled tasks pop entries as they resolve.
+            for future, check in list(waiters.items()):
+                self.logger.debug(f"Dispatching an wait_for: {event_name}.")
+
+                if check is None:
+                    # No check to await, so the waiter resolves inline
+                    # instead of paying for a task per dispatch. Futures
+                    # cancelled by a timed-out wait_for reject set_result,
+                    # but still get purged from the bucket.
+                    if not future.done():
+                        future.set_result(
+                            args + tuple(kwargs.values()) if kwargs else args
+                        )
+                    resolved.append(future)
+                else:
+                    self.loop.create_task(
+                        self._run_future(event_name, future, check, *args, **kwargs)
+                    )
+
+            if resolved:
+                for future in resolved:
+                    waiters.pop(future, None)
+
+                if not waiters:
+                    del self._wait_for_futures[event_name]
+
+        handlers = self._resolved_handlers.get(event_name)
+        if handlers is None:
+            handlers = self._resolve_handlers(event_name)
+
+        for event in handlers:
+            self.logger.debug(f"Dispatching an event: {event_name}.")
+            self.loop.create_task(event(*args, **kwargs))
+
+    def _resolve_handlers(self, event_name: str) -> tuple[Callable[..., Coroutine], ...]:
+        # getattr walks the client MRO and iscoroutinefunction inspects
+        # code flags; handlers don't change at runtime, so both run
+        # once per event name instead of on every dispatch.
+        handlers: tuple[Callable[..., Coroutine], ...] = tuple(
+            event
+            for event in (
+                self.events.get(event_name),
+                getattr(self.client, event_name, None),
             )
+            if event is not None and iscoroutinefunction(event)
+        )
 
-        for event in (
-            self.events.get(event_name),
-            getattr(self.client, event_name, None),
-        ):
-            if event is not None and iscoroutinefunction(event):
-                self.logger.debug(f"Dispatching an event: {event_name}.")
-                self.loop.create_task(event(*args, **kwargs))
+        self._resolved_handlers[event_name] = handlers
+        return handlers
 
     async def wait_for(
         self, event_name: str, check: WaitForCheck | None = None
@@ -186,10 +253,14 @@ class Dispatcher(Generic[ObjectT]):
         check:
             Optional check which must be True for the event to return a result.
         """
-        event_name = event_name.lower()
+        event_name = _lower_name(event_name)
         future: Future = Future()
 
-        self._wait_for_futures[event_name].append((future, check))
+        waiters = self._wait_for_futures.get(event_name)
+        if waiters is None:
+            waiters = self._wait_for_futures[event_name] = {}
+
+        waiters[future] = check
         result = await future
         return result
 
@@ -206,5 +277,19 @@ class Dispatcher(Generic[ObjectT]):
             if not result:
                 return
 
-        future.set_result(tuple(args) + tuple(kwargs.values()))
-        self._wait_for_futures[event_name].remove((future, check))
+        # args is already a tuple; the concat only happens when kwargs
+        # actually carry values. A future cancelled by a timed-out
+        # wait_for rejects set_result, but still needs the cleanup below.
+        if not future.done():
+            future.set_result(args + tuple(kwargs.values()) if kwargs else args)
+
+        waiters: dict[Future, WaitForCheck | None] | None = self._wait_for_futures.get(
+            event_name
+        )
+        if waiters is not None:
+            waiters.pop(future, None)
+
+            if not waiters:
+                # Drop the empty bucket so one-shot event names don't
+                # accumulate in the outer dict.
+                del self._wait_for_futures[event_name]
@@ -83,6 +83,8 @@ class Parser:
             return await flag_args(response)
 
     async def on_user_ready_args(self, response: GatewayResponse) -> tuple[SelfBot]:
+        response.user._session_id = response.data.get("session_id")
+
         await self._chunk_user(response.user, data=response.data)
         response.user._ready.set()
         return (response.user,)
@@ -411,7 +413,7 @@ class Parser:
 
         for guild_emoji in guild.emojis:
             if guild_emoji not in updated_emojis:
-                guild._remove_emoji(guild_emoji)
+                guild._remove_emoji(guild_emoji.id)
                 removed_emojis.append(guild_emoji)
 
         for updated_emoji in updated_emojis:
@@ -34,6 +34,7 @@ from asyncio import get_event_loop, TimeoutError
 from base64 import b64encode
 
 from ..errors import Unauthorized, HTTPTimeoutError
+from ..utils import json_loads
 from ..types import Authorization, MessageReference, OverwritePayload, RatelimitPayload
 from ..discord import Permissions, Role, GuildMember
 
@@ -256,7 +257,7 @@ class HTTPClient:
                 raise HTTPTimeoutError(f"Reached timeout limit under route: {route}")
 
             if request_manager.is_ratelimited(response):
-                data: dict = await response.json()
+                data: dict = await response.json(loads=json_loads)
                 retry_after: float = data["retry_after"]
                 global_ratelimit: bool = data.get("global", False)
 
@@ -309,7 +310,7 @@ class HTTPClient:
 
         try:
             response: ClientResponse = await self.request(route)
-            data: dict[str, Any] = await response.json()
+            data: dict[str, Any] = await response.json(loads=json_loads)
         except Unauthorized:
             return
 
@@ -338,7 +339,7 @@ class HTTPClient:
             headers=user.authorization.headers,
         )
         response: ClientResponse = await self.request(route, user=user)
-        return await response.json()
+        return await response.json(loads=json_loads)
 
     async def create_dm(self, user: SelfBot, user_id: int) -> dict[str, Any]:
         """
@@ -361,7 +362,7 @@ class HTTPClient:
         response: ClientResponse = await self.request(
             route, json={"recipient_id": user_id}, user=user
         )
-        return await response.json()
+        return await response.json(loads=json_loads)
 
     async def send_friend_request(self, user: SelfBot, user_id: int) -> None:
         """
@@ -420,7 +421,7 @@ class HTTPClient:
         )
 
         response: ClientResponse = await self.request(route, user=user)
-        return await response.json()
+        return await response.json(loads=json_loads)
 
     async def send_message(
         self,
@@ -459,7 +460,9 @@ class HTTPClient:
 
         payload: dict[str, Any] = {
             "content": message_content,
-            "message_reference": message_reference,
+            "message_reference": (
+                message_reference._asdict() if message_reference else None
+            ),
         }
 
         if attachments:
@@ -469,7 +472,7 @@ class HTTPClient:
             payload["allowed_mentions"] = {"replied_user": reply_mention}
 
         response: ClientResponse = await self.request(route, payload, user)
-        return await response.json()
+        return await response.json(loads=json_loads)
 
     async def upload_attachments(
         self, user: SelfBot, channel_id: int, files: list[dict[str, Any]]
@@ -498,7 +501,7 @@ class HTTPClient:
         payload: dict[str, Any] = {"files": files}
 
         response: ClientResponse = await self.request(route, payload, user)
-        return await response.json()
+        return await response.json(loads=json_loads)
 
     async def upload_file(self, upload_url: str, file_bytes: bytes) -> None:
         """
@@ -557,7 +560,7 @@ class HTTPClient:
         )
 
         response: ClientResponse = await self.request(route, user=user)
-        return await response.json()
+        return await response.json(loads=json_loads)
 
     async def delete_message(
         self, user: SelfBot, channel_id: int, message_id: int
@@ -624,7 +627,7 @@ class HTTPClient:
 
         response: ClientResponse = await self.request(route, json=payload, user=user)
 
-        return await response.json()
+        return await response.json(loads=json_loads)
 
     async def fetch_guild_roles(
         self, user: SelfBot, guild_id: int
@@ -647,7 +650,7 @@ class HTTPClient:
         )
 
         response: ClientResponse = await self.request(route, user=user)
-        return await response.json()
+        return await response.json(loads=json_loads)
 
     async def edit_role(
         self, user: SelfBot, guild_id: int, role: Role, params: dict[str, Any]
@@ -681,7 +684,7 @@ class HTTPClient:
             params["permissions"] = role.permissions.get_bitwise_by_flags()
 
         response: ClientResponse = await self.request(route, json=params, user=user)
-        return await response.json()
+        return await response.json(loads=json_loads)
 
     async def delete_role(self, user: SelfBot, guild_id: int, role_id: int) -> None:
         """
@@ -725,7 +728,7 @@ class HTTPClient:
         )
 
         response: ClientResponse = await self.request(route, user=user)
-        return await response.json()
+        return await response.json(loads=json_loads)
 
     async def fetch_channels(
         self, user: SelfBot, guild_id: int
@@ -748,7 +751,7 @@ class HTTPClient:
         )
 
         response: ClientResponse = await self.request(route, user=user)
-        return await response.json()
+        return await response.json(loads=json_loads)
 
     async def edit_channel(
         self, user: SelfBot, channel_id: int, params: dict[str, Any]
@@ -790,7 +793,7 @@ class HTTPClient:
             params["permission_overwrites"] = overwrites_payload
 
         response: ClientResponse = await self.request(route, json=params, user=user)
-        return await response.json()
+        return await response.json(loads=json_loads)
 
     async def delete_channel(self, user: SelfBot, channel_id: int) -> None:
         """
@@ -836,7 +839,7 @@ class HTTPClient:
         )
 
         response: ClientResponse = await self.request(route, user=user)
-        return await response.json()
+        return await response.json(loads=json_loads)
 
     async def edit_member(
         self, user: SelfBot, guild_id: int, member: GuildMember, params: dict[str, Any]
@@ -907,7 +910,7 @@ class HTTPClient:
             del params["roles"]
 
         response: ClientResponse = await self.request(route, json=params, user=user)
-        return await response.json()
+        return await response.json(loads=json_loads)
 
     async def fetch_user_profile(
         self, user: SelfBot, user_id: int, **settings: Any
@@ -938,7 +941,7 @@ class HTTPClient:
 
         response: ClientResponse = await self.request(route, user=user)
 
-        return await response.json()
+        return await response.json(loads=json_loads)
 
     async def create_reaction(
         self, user: SelfBot, channel_id: int, message_id: int, emoji: str
@@ -1051,7 +1054,7 @@ class HTTPClient:
 
         response: ClientResponse = await self.request(route, user=user)
 
-        return await response.json()
+        return await response.json(loads=json_loads)
 
     async def fetch_guild_ban(
         self, user: SelfBot, guild_id: int, user_id: int
@@ -1077,7 +1080,7 @@ class HTTPClient:
 
         response: ClientResponse = await self.request(route, user=user)
 
-        return await response.json()
+        return await response.json(loads=json_loads)
 
     async def fetch_guild_bans(
         self, user: SelfBot, guild_id: int, limit: int = 1000
@@ -1103,7 +1106,7 @@ class HTTPClient:
 
         response: ClientResponse = await self.request(route, user=user)
 
-        return await response.json()
+        return await response.json(loads=json_loads)
 
     async def send_typing(self, user: SelfBot, channel_id: int) -> None:
         """
@@ -1147,7 +1150,7 @@ class HTTPClient:
             headers=user.authorization.headers,
         )
         response: ClientResponse = await self.request(route, json=params, user=user)
-        return await response.json()
+        return await response.json(loads=json_loads)
 
     async def create_channel(
         self, user: SelfBot, guild_id: int, params: dict[str, Any]
@@ -1172,7 +1175,7 @@ class HTTPClient:
         )
 
         response: ClientResponse = await self.request(route, json=params, user=user)
-        return await response.json()
+        return await response.json(loads=json_loads)
 
     async def unack_message(
         self, user: SelfBot, channel_id: int, message_id: int
@@ -1230,7 +1233,7 @@ class HTTPClient:
         )
 
         response: ClientResponse = await self.request(route, user=user)
-        return await response.json()
+        return await response.json(loads=json_loads)
 
     async def use_interaction(self, user: SelfBot, payload: dict[str, Any]) -> None:
         """
@@ -1279,4 +1282,4 @@ class HTTPClient:
             message_id=message_id,
         )
         response: ClientResponse = await self.request(route, user=user, json=payload)
-        return await response.json()
+        return await response.json(loads=json_loads)
@@ -91,6 +91,7 @@ class SelfBot(DiscordUser):
         "_dm_channels",
         "_users",
         "_ready",
+        "_session_id",
     )
 
     def __init__(self, token: str, user_data: dict[str, Any], http: HTTPClient) -> None:
@@ -116,6 +117,7 @@ class SelfBot(DiscordUser):
         self._dm_channels: dict[int, DMChannel] = {}
         self._users: dict[int, DiscordUser] = {}
         self._ready: Event = Event()
+        self._session_id: str | None = None
 
     def __repr__(self) -> str:
         return f"<SelfBot(global_name={self.global_name}, id={self.id})>"
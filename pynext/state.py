@@ -21,7 +21,7 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 from __future__ import annotations
-from typing import TYPE_CHECKING, AsyncIterable, Any, TypeVar
+from typing import TYPE_CHECKING, AsyncIterable, Any, Iterable, TypeVar
 
 from logging import Logger, getLogger
 
@@ -156,6 +156,30 @@ class State:
         self.logger.debug("Creating a attachment object...")
         return Attachment(data=data, message=message)
 
+    def create_attachments(
+        self, message: MessageT, datas: Iterable[dict[str, Any]]
+    ) -> list[Attachment[MessageT]]:
+        """
+        Method to create attachment objects from a raw payload list.
+
+        Batch variant of :func:`create_attachment` used on the
+        per-message path, logging once and binding the class lookup
+        outside the loop.
+
+        .. versionadded:: 1.2.0
+
+        Parameters
+        ----------
+        message:
+            Message to which the created attachments should belong.
+        datas:
+            Required data to create the attachment objects.
+        """
+        self.logger.debug("Creating attachment objects...")
+
+        attachment_cls = Attachment
+        return [attachment_cls(data=data, message=message) for data in datas]
+
     def create_application(self, data: dict[str, Any]) -> Application:
         """
         Method to create a application object from a data.
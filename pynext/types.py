@@ -21,7 +21,7 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 from __future__ import annotations
-from typing import TypedDict, TYPE_CHECKING, Union, TypeVar, Generic
+from typing import TypedDict, TYPE_CHECKING, Union, TypeVar, Generic, NamedTuple
 
 from dataclasses import dataclass
 
@@ -40,9 +40,12 @@ Channel = Union[
 Snowflake = Union[str, int]
 
 
-class MessageReference(TypedDict):
-    channel_id: Snowflake
-    message_id: Snowflake
+class MessageReference(NamedTuple):
+    # A fixed-layout tuple instead of a per-message dict; both ids are
+    # parsed to int once at construction. Use _asdict() when the
+    # reference has to go onto the wire.
+    channel_id: int
+    message_id: int
 
 
 class OverwritePayload(TypedDict):
@@ -21,8 +21,9 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 from __future__ import annotations
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
 
+from sys import intern
 from time import time
 from random import choice
 from string import ascii_letters, digits
@@ -48,7 +49,7 @@ async def text_or_json(response: ClientResponse) -> dict | str:
     # If the response is not json, then the text will be returned.
 
     try:
-        return await response.json()
+        return await response.json(loads=json_loads)
     except client_exceptions.ContentTypeError:
         return await response.text()
 
@@ -93,21 +94,35 @@ def json_dumps(value: Any) -> str:
     return json.dumps(value, separators=(",", ":"))
 
 
+def _intern_keys(obj: dict[str, Any]) -> dict[str, Any]:
+    # object_hook for the stdlib decoder. Interned keys let dict
+    # lookups in the object constructors hit the identity fast-path,
+    # since the literals used there are interned by the compiler.
+    return {intern(key): value for key, value in obj.items()}
+
+
 def json_loads(value: str) -> dict:
     # If we have orjson installed, we will use it.
     # Otherwise, we will use the standard json module.
     if INSTALLED_ORJSON is True:
         assert orjson
+        # orjson already caches short ascii keys on its own.
         return orjson.loads(value)
 
     assert json
-    return json.loads(value)
+    return json.loads(value, object_hook=_intern_keys)
+
+
+def snowflake_timestamp(object_id: int) -> float:
+    # POSIX timestamp of a snowflake without constructing a datetime.
+    # Much cheaper than snowflake_time when used as a sort key
+    # over large message batches.
+    return ((object_id >> 22) + DISCORD_EPOCH) / 1000
 
 
 def snowflake_time(object_id: int) -> datetime:
     # https://discord.com/developers/docs/reference#snowflakes
-    timestamp = ((object_id >> 22) + DISCORD_EPOCH) / 1000
-    return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+    return datetime.fromtimestamp(snowflake_timestamp(object_id), tz=timezone.utc)
 
 
 def str_to_datetime(value: str) -> datetime:
@@ -116,10 +131,11 @@ def str_to_datetime(value: str) -> datetime:
     return datetime.fromisoformat(value)
 
 
-def applications_filter(data: dict[str, Any]) -> dict[int, Any]:
+def applications_filter(data: dict[str, Any]) -> Iterator[dict[str, Any]]:
     # Method to filter applications and application commands.
     # Example: {"applications": [...], "application_commands": [...]}
-    # Return: {application_id: {"app_commands": [...], ...}, ...}
+    # The id-keyed dict is only needed internally to join commands
+    # to their application, so callers get the grouped payloads directly.
 
     apps: dict[int, dict[str, Any]] = {}
 
@@ -132,7 +148,7 @@ def applications_filter(data: dict[str, Any]) -> dict[int, Any]:
             app_commands: list[dict[str, Any]] = application_data["app_commands"]
             app_commands.append(command_data)
 
-    return apps
+    return iter(apps.values())
 
 
 def nonce() -> int: